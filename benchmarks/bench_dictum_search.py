@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Compare the tail-anchored dictum search with the full scan on the longest advices.
+
+The longest advices of the given CSV files (and synthetic ones of 100 KB up to about 1 MB)
+are classified with both match_standard_dictum_tail and match_standard_dictum, timing each
+and listing the texts where they differ. The generated texts of check_dictum_matcher.py,
+whose dictums all lie within the search window, must get identical results.
+
+Usage:
+    python benchmarks/bench_dictum_search.py [raad_van_state_adviezen_2024.csv ...] [--longest 50]
+
+Exits with status 1 if a generated text gets a different result.
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from analyzer import match_standard_dictum, match_standard_dictum_tail  # noqa: E402
+from advice_parser import AdvicePageParser  # noqa: E402
+from synthetic_pages import DICTUMS, detail_page  # noqa: E402
+from check_dictum_matcher import test_texts  # noqa: E402
+
+
+def synthetic_advices():
+    """Long advice texts, some quoting a dictum early on, as advices about earlier advices do"""
+    parser = AdvicePageParser()
+    texts = []
+    for number, paragraphs in enumerate((200, 500, 1000, 2000)):
+        content = parser.parse_advice_page(detail_page(2024, number, paragraphs=paragraphs))['content']
+        texts.append(content)
+        quote = f"In het eerdere advies overwoog zij: '{DICTUMS[(number + 1) % len(DICTUMS)]}' "
+        texts.append(quote + content)
+    return texts
+
+
+def time_search(search, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            search(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the tail-anchored dictum search against the full scan')
+    parser.add_argument('csv_files', nargs='*', help='Scraped advice CSV files to take the longest advices from')
+    parser.add_argument('--longest', type=int, default=50, help='Number of longest advices to compare')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger('advice_parser').setLevel(logging.ERROR)
+
+    mismatches = 0
+    for text in test_texts(random.Random(args.seed)):
+        if match_standard_dictum_tail(text) != match_standard_dictum(text):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"MISMATCH for {text[:120]!r}...")
+    print(f"Generated texts: {'all identical' if not mismatches else f'{mismatches} differ'}")
+
+    texts = synthetic_advices()
+    for csv_file in args.csv_files:
+        texts += [content for content in pd.read_csv(csv_file)['content'] if isinstance(content, str)]
+    texts = sorted(texts, key=len, reverse=True)[:args.longest]
+
+    differ = 0
+    for text in texts:
+        full, tail = match_standard_dictum(text), match_standard_dictum_tail(text)
+        if full != tail:
+            differ += 1
+            print(f"{len(text) / 1000:6.0f} KB: full scan {full[0]}, tail {tail[0]} ({tail[1][:60] if tail[1] else ''}...)")
+    full_time = time_search(match_standard_dictum, texts, args.repeat)
+    tail_time = time_search(match_standard_dictum_tail, texts, args.repeat)
+    sizes = sorted(len(text) for text in texts)
+    print(f"{len(texts)} longest advices, {sizes[0] / 1000:.0f}-{sizes[-1] / 1000:.0f} KB, "
+          f"{len(texts) - differ} classified identically")
+    print(f"full scan: {full_time / len(texts) * 1000:.2f} ms/advice, "
+          f"tail: {tail_time / len(texts) * 1000:.3f} ms/advice ({full_time / tail_time:.0f}x)")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Time AdviceAnalyzer.check_standard_dictums with 1, 2, 4 and 8 worker processes.
+
+The corpus is the content column of the given CSV files (e.g. all years), or synthetic advices
+otherwise. Each worker count must give exactly the results of the in-process run (processes=1).
+
+Usage:
+    python benchmarks/bench_dictum_workers.py [raad_van_state_adviezen_*.csv] [--workers 1,2,4,8]
+                                              [--dictum-search full] [--chunk-size 200]
+
+Exits with status 1 if any worker count gives different results.
+"""
+import os
+import sys
+import time
+import argparse
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+os.environ.setdefault('REPLICATE_API_TOKEN', 'not-needed-for-regex-checks')
+from analyzer import AdviceAnalyzer  # noqa: E402
+from synthetic_pages import DICTUMS  # noqa: E402
+
+
+def synthetic_corpus(advices, kilobytes):
+    """Advice texts of about the given size, most ending in a standard dictum"""
+    filler = "De Afdeling merkt op dat het voorstel op dit onderdeel nadere toelichting behoeft. "
+    body = filler * (kilobytes * 1000 // len(filler))
+    return [body + (DICTUMS[number % len(DICTUMS)] if number % 7 else "Met de Koning.")
+            for number in range(advices)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the parallel standard dictum check')
+    parser.add_argument('csv_files', nargs='*', help='Scraped advice CSV files to use as the corpus')
+    parser.add_argument('--workers', default='1,2,4,8', help='Comma-separated worker counts')
+    parser.add_argument('--dictum-search', choices=['tail', 'full'], default='full',
+                        help='Search strategy to time (full is the CPU-heavy one)')
+    parser.add_argument('--chunk-size', type=int, default=200, help='Advices sent to a worker at a time')
+    parser.add_argument('--advices', type=int, default=6000, help='Synthetic advices without CSV files')
+    parser.add_argument('--kilobytes', type=int, default=30, help='Size of each synthetic advice')
+    args = parser.parse_args()
+
+    if args.csv_files:
+        contents = [content for csv_file in args.csv_files for content in pd.read_csv(csv_file)['content']]
+    else:
+        contents = synthetic_corpus(args.advices, args.kilobytes)
+    megabytes = sum(len(content) for content in contents if isinstance(content, str)) / 1e6
+    print(f"{len(contents)} advices, {megabytes:.0f} MB, {args.dictum_search} search, {os.cpu_count()} CPUs")
+
+    analyzer = AdviceAnalyzer('', dictum_search=args.dictum_search, regex_only=True)
+    start = time.perf_counter()
+    expected = analyzer.check_standard_dictums(contents, processes=1)
+    serial = time.perf_counter() - start
+    print(f"in-process  {serial:7.2f} s")
+
+    failed = False
+    for workers in (int(count) for count in args.workers.split(',')):
+        start = time.perf_counter()
+        results = analyzer.check_standard_dictums(contents, processes=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        identical = results == expected
+        failed |= not identical
+        print(f"{workers:2d} workers  {elapsed:7.2f} s  {serial / elapsed:5.2f}x  "
+              f"{'identical' if identical else 'DIFFERENT RESULTS'}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of overview page parsing: the original full html.parser tree vs. the
+restricted parse in AdvicePageParser (lxml class lookup, or a SoupStrainer without lxml).
+
+Usage:
+    python benchmarks/bench_overview_parse.py [saved_overview.html ...] [--repeat 20]
+
+Without files a synthetic 200-entry overview page is used.
+"""
+import os
+import sys
+import time
+import argparse
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from advice_parser import AdvicePageParser, HTML_PARSER  # noqa: E402
+from synthetic_pages import overview_page  # noqa: E402
+
+BASE_URL = "https://www.raadvanstate.nl"
+
+
+def parse_overview_full(html, base_url):
+    """The original parse_overview_page: a complete html.parser tree of the page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    results = []
+    for entry in soup.find_all('div', class_='ipx-pt-advies'):
+        title_elem = entry.find('h2')
+        link = title_elem.find('a') if title_elem else None
+        url = link.get('href') if link else None
+        if url:
+            results.append({'url': url if url.startswith('http') else f"{base_url}{url}"})
+    return results
+
+
+def timeit(func, html, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(html, BASE_URL)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark overview page parsing')
+    parser.add_argument('html_files', nargs='*', help='Saved overview page HTML files')
+    parser.add_argument('--repeat', type=int, default=20, help='Timing repetitions per page (best is reported)')
+    args = parser.parse_args()
+
+    pages = []
+    for html_file in args.html_files:
+        with open(html_file, encoding='utf-8') as f:
+            pages.append((os.path.basename(html_file), f.read()))
+    if not pages:
+        pages.append(('synthetic-200', overview_page(2024, 0, 200, 200)))
+
+    advice_parser = AdvicePageParser()
+
+    def parse_overview_strainer(html, base_url):
+        return [{'url': url if url.startswith('http') else f"{base_url}{url}"}
+                for _, _, url in advice_parser.overview_hrefs_soup(html) if url]
+
+    variants = [('full html.parser', parse_overview_full),
+                (f'SoupStrainer/{HTML_PARSER}', parse_overview_strainer),
+                ('parse_overview_page', advice_parser.parse_overview_page)]
+
+    print(f"{'page':<20} {'entries':>7}" + "".join(f" {name + ' (ms)':>26}" for name, _ in variants))
+    for name, html in pages:
+        timings = []
+        baseline = None
+        for variant, func in variants:
+            elapsed, result = timeit(func, html, args.repeat)
+            if baseline is None:
+                baseline = result
+            elif result != baseline:
+                print(f"{name}: {variant} differs from the full parse ({len(result)} vs {len(baseline)} entries)")
+                sys.exit(1)
+            timings.append(elapsed)
+        print(f"{name:<20} {len(baseline):>7}" + "".join(
+            f" {t * 1000:>17.2f} ({timings[0] / t:>4.1f}x)" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
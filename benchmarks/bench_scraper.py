@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""End-to-end scraper benchmark against the local replay server.
+
+Runs RaadVanStateScraper.scrape() for one year per backend and concurrency level, each in a
+fresh process, and reports pages/second, p50/p95 latency per phase (overview fetch, detail
+request or page load, HTML parsing) and peak RSS of the scraper process and of its children (chromedriver
+and Chrome for the selenium backend).
+
+Usage:
+    python benchmarks/bench_scraper.py [--backends http,selenium] [--concurrency 1,2,4,8]
+                                       [--advices 400] [--latency 20] [--archive-dir page_archive]
+                                       [--json results.json]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import resource
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from replay_server import ReplayServer  # noqa: E402
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def timed(func, times, state=None):
+    """Wrap a function so each call's duration is appended to times, flagging state['active'] meanwhile"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        if state is not None:
+            state['active'] = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if state is not None:
+                state['active'] = False
+            times.append(time.perf_counter() - start)
+    return wrapper
+
+
+def recorded_latency(record, times, overview):
+    """Wrap HttpFetcher.record to keep the latency of each detail request.
+
+    record() gets the moment the request left the semaphore and rate limiter, so this is the
+    request latency without queueing. Overview pages are fetched one at a time between the
+    detail batches, so requests made while overview['active'] is set are skipped.
+    """
+    @functools.wraps(record)
+    def wrapper(request_start, **kwargs):
+        if not overview['active']:
+            times.append(time.time() - request_start)
+        return record(request_start, **kwargs)
+    return wrapper
+
+
+def run_scrape(base_url, backend, concurrency, year, max_rate):
+    """Child process: scrape one year and return throughput, phase latencies and peak RSS"""
+    logging.disable(logging.WARNING)
+    from scraper import RaadVanStateScraper
+
+    start = time.perf_counter()
+    scraper = RaadVanStateScraper(year=year, backend=backend, concurrency=concurrency,
+                                  workers=concurrency if backend == 'selenium' else 1,
+                                  base_url=base_url, max_rate=max_rate)
+    startup = time.perf_counter() - start
+    # The replay server needs no slow start, so the limiter begins at its ceiling
+    scraper.rate_limiter.rate = max_rate
+
+    phases = {'overview': [], 'detail': [], 'parse': []}
+    overview = {'active': False}
+    scraper.get_page_content = timed(scraper.get_page_content, phases['overview'], overview)
+    if backend == 'http':
+        scraper.http.record = recorded_latency(scraper.http.record, phases['detail'], overview)
+    else:
+        scraper.get_advice_content = timed(scraper.get_advice_content, phases['detail'])
+    scraper.parser.parse_overview_page = timed(scraper.parser.parse_overview_page, phases['parse'])
+    scraper.parser.parse_advice_page = timed(scraper.parser.parse_advice_page, phases['parse'])
+
+    start = time.perf_counter()
+    try:
+        df = scraper.scrape()
+    finally:
+        scraper.close()
+    elapsed = time.perf_counter() - start
+
+    pages = len(phases['overview']) + len(df)
+    return {
+        'backend': backend,
+        'concurrency': concurrency,
+        'advices': len(df),
+        'pages': pages,
+        'startup_seconds': round(startup, 3),
+        'seconds': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2),
+        'latency_ms': {
+            phase: {'p50': round(1000 * percentile(times, 0.5), 1), 'p95': round(1000 * percentile(times, 0.95), 1)}
+            for phase, times in phases.items() if times
+        },
+        # ru_maxrss is in KB on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'children_peak_rss_mb': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scraper end to end against a local replay server')
+    parser.add_argument('--backends', default='http,selenium', help='Comma-separated backends to run')
+    parser.add_argument('--concurrency', default='1,2,4,8',
+                        help='Comma-separated levels: parallel requests (http) or Chrome drivers (selenium)')
+    parser.add_argument('--year', default='2024', help='Year to scrape')
+    parser.add_argument('--advices', type=int, default=400, help='Synthetic advices in the year')
+    parser.add_argument('--latency', type=float, default=20.0, help='Milliseconds the server adds to every response')
+    parser.add_argument('--max-rate', type=float, default=1000.0, help='Rate limiter ceiling in requests/second')
+    parser.add_argument('--archive-dir', type=str, default=None, help='Replay recorded pages instead of synthetic ones')
+    parser.add_argument('--json', type=str, default=None, help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = []
+    with ReplayServer(advices=args.advices, latency=args.latency / 1000, archive_dir=args.archive_dir) as server:
+        print(f"Replay server on {server.url}, {args.latency:.0f} ms latency")
+        for backend in args.backends.split(','):
+            for concurrency in (int(level) for level in args.concurrency.split(',')):
+                # A fresh process per run, so peak RSS belongs to that run alone
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(run_scrape, server.url, backend, concurrency, args.year, args.max_rate)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"{backend:>8} x{concurrency:<2}  failed: {e}")
+                        results.append({'backend': backend, 'concurrency': concurrency, 'error': str(e)})
+                        continue
+                results.append(result)
+                latency = '  '.join(f"{phase} {values['p50']:.1f}/{values['p95']:.1f}"
+                                    for phase, values in result['latency_ms'].items())
+                print(f"{backend:>8} x{concurrency:<2}  {result['pages_per_second']:7.1f} pages/s  "
+                      f"{result['pages']} pages in {result['seconds']:.2f}s  p50/p95 ms: {latency}  "
+                      f"RSS {result['peak_rss_mb']:.0f} MB (+{result['children_peak_rss_mb']:.0f} MB children)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
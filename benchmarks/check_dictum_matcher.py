@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Check that the precompiled dictum matcher in analyzer.py classifies exactly like the original
+per-pattern implementation, and time both.
+
+Every combination of the variable parts of the eight standard dictum patterns is generated, with
+case, whitespace and line-break changes, surrounding text, near misses and several dictums in one
+text (to check which category wins). Saved advice CSV files can be added to compare on real data.
+
+Usage:
+    python benchmarks/check_dictum_matcher.py [raad_van_state_adviezen_2024.csv ...] [--repeat 3]
+
+Exits with status 1 if any text gets a different result.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import itertools
+from types import SimpleNamespace
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+os.environ.setdefault('REPLICATE_API_TOKEN', 'not-needed-for-regex-checks')
+from analyzer import AdviceAnalyzer  # noqa: E402
+from synthetic_pages import DICTUMS, detail_page  # noqa: E402
+
+
+def legacy_check_standard_dictum(text):
+    """AdviceAnalyzer.check_standard_dictum before the precompiled matcher, kept verbatim as the reference"""
+    import re
+
+    # Helper function to make spaces flexible
+    def flex(s):
+        """Make spaces optional in a pattern string"""
+        return r'\s*'.join(s.split())
+
+    # Common starting phrase with flexible spaces
+    start = flex("De Afdeling advisering van de Raad van State heeft")
+
+    # Parts that can vary in multiple patterns
+    proposal_vars = r'(het\s+voorstel|de\s+ontwerpbesluiten|het\s+ontwerpbesluit)'
+    proposal_ref = r'(het\s+voorstel|deze|het)'
+    bij_over = r'(bij|over)'
+    besluit_vars = r'(het|een)\s+besluit'
+
+    # Define patterns with variations
+    patterns = {
+        'A': [
+            # Standard Tweede Kamer variant
+            rf'{start}\s+geen\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
+            # Besluit variant
+            rf'{start}\s+geen\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+te\s+nemen'
+        ],
+
+        'B': [
+            # Standard Tweede Kamer variant
+            rf'{start}\s+een\s+aantal\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{proposal_ref}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+(wordt|worden)\s+ingediend',
+            # Besluit variant
+            rf'{start}\s+een\s+aantal\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{besluit_vars}\s+(wordt|worden)\s+genomen'
+        ],
+
+        'C': [
+            # Standard Tweede Kamer variant
+            rf'{start}\s+(een\s+aantal\s+)?bezwaren\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast',
+            # Besluit variant
+            rf'{start}\s+(een\s+aantal\s+)?bezwaren\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+niet\s+te\s+nemen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast'
+        ],
+
+        'D': [
+            # Standard Tweede Kamer variant
+            rf'{start}\s+ernstige\s+bezwaren\s+tegen\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
+            # Besluit variant
+            rf'{start}\s+ernstige\s+bezwaren\s+tegen\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+niet\s+te\s+nemen'
+        ]
+    }
+
+    # Normalize spaces in input text
+    text = ' '.join(text.split())
+
+    # Check each pattern
+    for category, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            # Add word boundaries where appropriate
+            pattern = rf"\b{pattern}\b"
+            matches = re.search(pattern, text, re.IGNORECASE)
+            if matches:
+                matched_text = matches.group(0)
+                return category, f"Found standard dictum category {category}. Matched text: {matched_text}"
+
+    return None, None
+
+
+START = "De Afdeling advisering van de Raad van State heeft"
+PROPOSALS = ["het voorstel", "de ontwerpbesluiten", "het ontwerpbesluit"]
+REFERENCES = ["het voorstel", "deze", "het"]
+BESLUITEN = ["het besluit", "een besluit"]
+
+
+def dictum_variants():
+    """Every standard dictum the patterns accept, one per combination of their variable parts"""
+    for bij, proposal, reference in itertools.product(["bij", "over"], PROPOSALS, REFERENCES):
+        yield f"{START} geen opmerkingen {bij} {proposal} en adviseert {reference} bij de Tweede Kamer der Staten-Generaal in te dienen."
+        for verb in ["wordt", "worden"]:
+            yield (f"{START} een aantal opmerkingen {bij} {proposal} en adviseert daarmee rekening te houden "
+                   f"voordat {reference} bij de Tweede Kamer der Staten-Generaal {verb} ingediend.")
+        for some, it, be in itertools.product(["een aantal ", ""], ["het", "deze"], ["is", "zijn"]):
+            yield (f"{START} {some}bezwaren {bij} {proposal} en adviseert {reference} niet bij de Tweede Kamer "
+                   f"der Staten-Generaal in te dienen, tenzij {it} {be} aangepast.")
+        yield f"{START} ernstige bezwaren tegen {proposal} en adviseert {reference} niet bij de Tweede Kamer der Staten-Generaal in te dienen."
+    for bij, proposal, besluit in itertools.product(["bij", "over"], PROPOSALS, BESLUITEN):
+        yield f"{START} geen opmerkingen {bij} {proposal} en adviseert {besluit} te nemen."
+        for verb in ["wordt", "worden"]:
+            yield (f"{START} een aantal opmerkingen {bij} {proposal} en adviseert daarmee rekening te houden "
+                   f"voordat {besluit} {verb} genomen.")
+        for some, it, be in itertools.product(["een aantal ", ""], ["het", "deze"], ["is", "zijn"]):
+            yield f"{START} {some}bezwaren {bij} {proposal} en adviseert {besluit} niet te nemen, tenzij {it} {be} aangepast."
+        yield f"{START} ernstige bezwaren tegen {proposal} en adviseert {besluit} niet te nemen."
+
+
+def perturb(text, rng):
+    """The same dictum with changed case, spacing and line breaks"""
+    words = text.split()
+    choice = rng.randrange(5)
+    if choice == 0:
+        return text.upper()
+    if choice == 1:
+        return text.lower()
+    if choice == 2:
+        return ''.join(word + rng.choice([' ', '  ', '\n', '\t ', ' \n  ']) for word in words)
+    if choice == 3:
+        # The start phrase also matches without spaces
+        return text.replace(START, START.replace(' ', ''))
+    return ' '.join(word.capitalize() if rng.random() < 0.2 else word for word in words)
+
+
+def near_miss(text, rng):
+    """The dictum with one word dropped or doubled, which mostly should not match"""
+    words = text.split()
+    i = rng.randrange(len(words))
+    if rng.random() < 0.5:
+        return ' '.join(words[:i] + words[i + 1:])
+    return ' '.join(words[:i + 1] + words[i:])
+
+
+def test_texts(rng):
+    variants = list(dictum_variants())
+    noise = "Dit is een overweging van de Afdeling over het voorstel. " * 20
+    texts = list(variants)
+    texts += [perturb(variant, rng) for variant in variants for _ in range(3)]
+    texts += [noise + variant + " De vice-president van de Raad van State," for variant in variants]
+    texts += [near_miss(variant, rng) for variant in variants for _ in range(3)]
+    # Several dictums in one text, in random order, to check which one wins
+    texts += [' '.join(rng.sample(variants, rng.randint(2, 4))) for _ in range(2000)]
+    texts += [variant[:-1] + "s." for variant in variants]  # No word boundary at the end
+    texts += ["x" + variant for variant in variants]  # No word boundary at the start
+    texts += DICTUMS + [detail_page(2024, number) for number in range(8)]
+    texts += ["", "   ", noise]
+    return texts
+
+
+def time_matcher(check, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            check(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the precompiled dictum matcher with the original one')
+    parser.add_argument('csv_files', nargs='*', help='Scraped advice CSV files to include')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    texts = test_texts(random.Random(args.seed))
+    generated = len(texts)
+    for csv_file in args.csv_files:
+        texts += [content for content in pd.read_csv(csv_file)['content'] if isinstance(content, str)]
+
+    # The full scan; bench_dictum_search.py compares the tail search with it
+    analyzer = SimpleNamespace(dictum_search='full')
+
+    def check(text):
+        return AdviceAnalyzer.check_standard_dictum(analyzer, text)
+
+    mismatches = 0
+    categories = {}
+    for text in texts:
+        expected, actual = legacy_check_standard_dictum(text), check(text)
+        categories[expected[0]] = categories.get(expected[0], 0) + 1
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"MISMATCH for {text[:120]!r}...\n  original: {expected}\n  new:      {actual}")
+
+    summary = ', '.join(f"{category or 'none'}: {n}" for category, n in sorted(categories.items(), key=str))
+    print(f"{len(texts)} texts ({generated} generated, {len(texts) - generated} from CSV files); "
+          f"original results {summary}")
+    legacy_time = time_matcher(legacy_check_standard_dictum, texts, args.repeat)
+    new_time = time_matcher(check, texts, args.repeat)
+    print(f"original: {legacy_time * 1000:.0f} ms, precompiled: {new_time * 1000:.0f} ms "
+          f"({legacy_time / new_time:.1f}x)")
+    if mismatches:
+        print(f"{mismatches} texts classified differently")
+        sys.exit(1)
+    print("All texts classified identically")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Check that the HTML parser extracts detail pages exactly like Selenium's element.text does.
+
+Every fixtures/<name>.html detail page is parsed with AdvicePageParser and compared field by
+field with fixtures/<name>.selenium.json, the values the default dom extraction reads from
+Chrome. The fixtures use inline markup (em, b, i, a, sup, span) in the middle of sentences and
+of the dictum, lists, tables, <br>, &nbsp;, comments and scripts. The standard dictum found
+in the content must be the expected one as well.
+
+With --record the expected values are read from the pages by the dom extraction in headless
+Chrome and written to the .selenium.json files (needs Chrome and chromedriver).
+
+Usage:
+    python benchmarks/check_element_text.py [--record]
+
+Exits with status 1 if any field differs.
+"""
+import os
+import sys
+import json
+import glob
+import logging
+import argparse
+import pathlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from advice_parser import AdvicePageParser  # noqa: E402
+from analyzer import match_standard_dictum  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def record(html_files):
+    """Write the dom extraction of each fixture, as done by the selenium backend, to its .selenium.json"""
+    from scraper import RaadVanStateScraper
+    scraper = RaadVanStateScraper(backend='selenium', extraction='dom')
+    try:
+        for html_file in html_files:
+            advice = scraper.get_advice_content(pathlib.Path(html_file).resolve().as_uri())
+            advice['dictum'] = match_standard_dictum(advice['content'] or '')[0]
+            with open(html_file.replace('.html', '.selenium.json'), 'w', encoding='utf-8') as f:
+                json.dump(advice, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            print(f"Recorded {html_file}")
+    finally:
+        scraper.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the HTML parser with Selenium's element.text on fixtures")
+    parser.add_argument('--record', action='store_true', help='Record the expected values with headless Chrome')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    html_files = sorted(glob.glob(os.path.join(FIXTURES, '*.html')))
+    if args.record:
+        record(html_files)
+
+    advice_parser = AdvicePageParser()
+    mismatches = 0
+    for html_file in html_files:
+        with open(html_file, encoding='utf-8') as f:
+            advice = advice_parser.parse_advice_page(f.read())
+        advice['dictum'] = match_standard_dictum(advice['content'] or '')[0]
+        with open(html_file.replace('.html', '.selenium.json'), encoding='utf-8') as f:
+            expected = json.load(f)
+        for field, value in expected.items():
+            if advice.get(field) != value:
+                mismatches += 1
+                print(f"MISMATCH in {os.path.basename(html_file)} {field}:\n"
+                      f"  selenium: {value!r}\n  parser:   {advice.get(field)!r}")
+    print(f"{len(html_files)} fixtures, {'all fields identical' if not mismatches else f'{mismatches} fields differ'}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Local HTTP server that mimics the raadvanstate.nl URL scheme for benchmarks and offline runs.
+
+Overview pages answer /adviezen/?...&pager_rows=N&kalenderjaar=YYYY&pager_page=P and detail
+pages the paths their entries link to. Pages are either synthetic (see synthetic_pages.py) or
+replayed from a page archive recorded with `scraper.py --archive-dir`.
+
+Usage:
+    python benchmarks/replay_server.py [--port 8000] [--advices 500] [--latency 20]
+    python benchmarks/replay_server.py --archive-dir page_archive
+    python src/scraper.py --year 2024 --backend http --base-url http://127.0.0.1:8000
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from page_archive import PageArchive  # noqa: E402
+from synthetic_pages import overview_page, detail_page  # noqa: E402
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        if server.recorded is not None:
+            html = self.recorded_page(parts)
+        elif parts.path.rstrip('/') == '/adviezen' and 'pager_page' in query:
+            year = int(query.get('kalenderjaar', ['2024'])[0])
+            rows = int(query.get('pager_rows', ['10'])[0])
+            if server.max_rows:
+                # Like a server that silently caps the page size
+                rows = min(rows, server.max_rows)
+            html = overview_page(year, int(query['pager_page'][0]), rows, server.advices)
+        elif parts.path.startswith('/adviezen/@'):
+            key = parts.path.split('@', 1)[1].split('/', 1)[0]
+            html = detail_page(int(key[:4]), int(key[4:]), paragraphs=server.paragraphs)
+        else:
+            html = None
+
+        if html is None:
+            self.send_error(404)
+            return
+        body = html.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.requests += 1
+
+    def recorded_page(self, parts):
+        target = server_key(parts)
+        found = self.server.recorded.get(target)
+        if found is None:
+            return None
+        year, entry = found
+        return self.server.archive.read(year, entry)['html']
+
+
+def server_key(parts):
+    """Path and query of a URL, which is how recorded pages are looked up.
+
+    Unquoted, since HTTP clients differ in which characters they escape (aiohttp sends %3A as :).
+    """
+    return unquote(f"{parts.path}?{parts.query}" if parts.query else parts.path)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Replay server running in a background thread; use as a context manager"""
+    daemon_threads = True
+
+    def __init__(self, port=0, advices=500, paragraphs=40, latency=0.0, max_rows=None, archive_dir=None):
+        super().__init__(('127.0.0.1', port), ReplayHandler)
+        self.advices = advices
+        self.paragraphs = paragraphs
+        self.latency = latency
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.archive = None
+        self.recorded = None
+        if archive_dir:
+            self.archive = PageArchive(archive_dir)
+            self.recorded = {}
+            for year in self.archive.years():
+                for entry in self.archive.entries(year):
+                    self.recorded[server_key(urlsplit(entry['url']))] = (year, entry)
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, name='replay-server', daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve synthetic or recorded Raad van State pages locally')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--advices', type=int, default=500, help='Synthetic advices per year')
+    parser.add_argument('--paragraphs', type=int, default=40, help='Paragraphs per synthetic detail page')
+    parser.add_argument('--latency', type=float, default=0.0, help='Milliseconds added to every response')
+    parser.add_argument('--max-rows', type=int, default=None, help='Cap pager_rows like a server with a page limit')
+    parser.add_argument('--archive-dir', type=str, default=None, help='Replay pages from this page archive')
+    args = parser.parse_args()
+
+    server = ReplayServer(args.port, args.advices, args.paragraphs, args.latency / 1000, args.max_rows, args.archive_dir)
+    source = f"{len(server.recorded)} recorded pages" if server.recorded is not None else f"{args.advices} synthetic advices per year"
+    print(f"Serving {source} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
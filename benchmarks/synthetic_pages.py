@@ -0,0 +1,75 @@
+"""Synthetic overview and detail pages with the same markup the scraper relies on."""
+
+PAGE_HEADER = """<!DOCTYPE html>
+<html lang="nl">
+<head>
+<meta charset="utf-8">
+<title>Adviezen - Raad van State</title>
+<link rel="stylesheet" href="/static/css/main.css">
+<script src="/static/js/main.js"></script>
+</head>
+<body>
+<header class="site-header"><nav><ul>
+""" + "".join(f'<li class="nav-item"><a href="/menu/{i}/">Menu item {i}</a></li>\n' for i in range(40)) + """</ul></nav></header>
+<main id="content">
+"""
+
+PAGE_FOOTER = """</main>
+<footer class="site-footer">
+""" + "".join(f'<p class="footer-line">Voettekst regel {i} met <a href="/link/{i}/">een link</a></p>\n' for i in range(30)) + """</footer>
+</body>
+</html>
+"""
+
+DICTUMS = [
+    "De Afdeling advisering van de Raad van State heeft geen opmerkingen bij het voorstel en adviseert het voorstel bij de Tweede Kamer der Staten-Generaal in te dienen.",
+    "De Afdeling advisering van de Raad van State heeft een aantal opmerkingen bij het voorstel en adviseert daarmee rekening te houden voordat het voorstel bij de Tweede Kamer der Staten-Generaal wordt ingediend.",
+    "De Afdeling advisering van de Raad van State heeft een aantal bezwaren bij het voorstel en adviseert het voorstel niet bij de Tweede Kamer der Staten-Generaal in te dienen, tenzij het is aangepast.",
+    "De Afdeling advisering van de Raad van State heeft ernstige bezwaren tegen het voorstel en adviseert het niet bij de Tweede Kamer der Staten-Generaal in te dienen.",
+]
+
+
+def advice_path(year, number):
+    """Path of a synthetic advice detail page"""
+    return f"/adviezen/@{year}{number:05d}/w01-{year % 100:02d}-{number:04d}-ii/"
+
+
+def overview_page(year, page, rows, total):
+    """An overview page listing entries page * rows .. (page + 1) * rows of a year with total advices"""
+    entries = []
+    for number in range(page * rows, min(total, (page + 1) * rows)):
+        entries.append(f"""<div class="ipx-pt-advies">
+<h2><a href="{advice_path(year, number)}">Voorstel van wet nummer {number} ({year})</a></h2>
+<div class="meta"><span class="kenmerk">W01.{year % 100:02d}.{number:04d}/II</span>
+<span class="datum">{1 + number % 28} januari {year}</span></div>
+<p class="samenvatting">Samenvatting van het advies over voorstel {number}. """ + "Lorem ipsum dolor sit amet. " * 5 + """</p>
+</div>
+""")
+    return PAGE_HEADER + f'<div class="results" data-rows="{rows}">\n' + "".join(entries) + "</div>\n" + PAGE_FOOTER
+
+
+def detail_page(year, number, paragraphs=40):
+    """A detail page for one advice, ending in one of the standard dictums"""
+    body = "".join(
+        f"<p>Punt {i}. De Afdeling merkt op dat het voorstel op onderdeel {i} nadere toelichting behoeft. "
+        + "Dit is vulltekst voor de omvang van het advies. " * 8 + "</p>\n"
+        for i in range(paragraphs)
+    )
+    dictum = DICTUMS[number % len(DICTUMS)]
+    advice_type = "Soort advies Wet" if number % 3 else "Soort advies Algemene maatregel van bestuur"
+    return PAGE_HEADER + f"""<article>
+<h1>Advies {number}</h1>
+<dl class="metadata">
+<dt>Kenmerk</dt><dd class="meta-value meta-value-kenmerk">W01.{year % 100:02d}.{number:04d}/II</dd>
+<dt>Aanhangig</dt><dd class="meta-value meta-value-datum-aanhangig">{1 + number % 28} januari {year}</dd>
+<dt>Vaststelling</dt><dd class="meta-value meta-value-datum-vaststelling">{1 + number % 28} februari {year}</dd>
+<dt>Advies</dt><dd class="meta-value meta-value-datum-advies">{1 + number % 28} maart {year}</dd>
+<dt>Publicatie</dt><dd class="meta-value meta-value-datum-publicatie">{1 + number % 28} april {year}</dd>
+</dl>
+<ul class="trefwoorden"><li title="Thema Bestuur">Bestuur</li><li title="{advice_type}">{advice_type}</li></ul>
+<div id="volledigetekst">
+{body}<p>{dictum}</p>
+<p>De vice-president van de Raad van State,</p>
+</div>
+</article>
+""" + PAGE_FOOTER
@@ -0,0 +1,228 @@
+import re
+import time
+import json
+import hashlib
+import logging
+import argparse
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# lxml is much faster than the stdlib parser; fall back to it if lxml is not installed
+try:
+    import lxml.html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# Without lxml, only the advice entries of an overview page are turned into a tree
+OVERVIEW_ENTRIES = SoupStrainer('div', class_='ipx-pt-advies')
+
+# Map of the metadata CSS classes on a detail page to our column names
+DATE_CLASSES = {
+    'meta-value-datum-aanhangig': 'datum_aanhangig',
+    'meta-value-datum-vaststelling': 'datum_vaststelling',
+    'meta-value-datum-advies': 'datum_advies',
+    'meta-value-datum-publicatie': 'datum_publicatie'
+}
+
+ADVICE_TYPES = {
+    "Soort advies Wet": "Wet",
+    "Soort advies Algemene maatregel van bestuur": "AMVB"
+}
+
+
+def empty_advice():
+    """Return an advice record with all fields unset"""
+    return {
+        'content': None,
+        'reference': None,
+        'advice_type': None,
+        'datum_aanhangig': None,
+        'datum_vaststelling': None,
+        'datum_advies': None,
+        'datum_publicatie': None
+    }
+
+
+# Fields covered by an advice's content hash, in hashing order
+HASHED_FIELDS = ['reference', 'advice_type', 'datum_aanhangig', 'datum_vaststelling', 'datum_advies', 'datum_publicatie']
+
+
+def advice_hash(advice):
+    """SHA-256 over the whitespace-normalized content and the metadata of an advice, or None without content.
+
+    Missing values (None, or NaN from a CSV file) hash as empty strings, so a
+    fresh scrape and a row read back from disk agree.
+    """
+    content = advice.get('content')
+    if not isinstance(content, str) or not content.strip():
+        return None
+    values = [' '.join(content.split())]
+    values.extend(advice.get(field) if isinstance(advice.get(field), str) else '' for field in HASHED_FIELDS)
+    return hashlib.sha256('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+
+# Elements rendered as blocks, which Selenium's element.text puts on their own lines
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'center', 'dd', 'details', 'dialog', 'dir', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'li', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'caption', 'thead', 'tbody',
+    'tfoot', 'tr', 'ul'
+}
+# Elements that are never rendered
+HIDDEN_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title', 'meta', 'link'}
+# Collapsible whitespace; non-breaking spaces are kept, like in a browser
+COLLAPSIBLE_WHITESPACE = re.compile(r'[ \t\n\r\f]+')
+
+
+def element_text(element):
+    """Approximate Selenium's element.text: block elements and <br> start a new line, inline
+    elements run on within their line, whitespace is collapsed, blank lines are dropped"""
+    lines = ['']
+    collect_text(element, lines)
+    lines = (COLLAPSIBLE_WHITESPACE.sub(' ', line).strip(' ').replace('\xa0', ' ') for line in lines)
+    return '\n'.join(line for line in lines if line)
+
+
+def collect_text(element, lines):
+    """Append the text of an element's children to lines, opening new lines at block boundaries"""
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            # Comments, doctypes and the like are NavigableString subclasses too
+            if type(child) is NavigableString:
+                lines[-1] += child
+        elif child.name in HIDDEN_TAGS:
+            continue
+        elif child.name == 'br':
+            lines.append('')
+        elif child.name in BLOCK_TAGS:
+            lines.append('')
+            collect_text(child, lines)
+            lines.append('')
+        else:
+            if child.name in ('td', 'th'):
+                # Table cells of a row are separated by a space
+                lines[-1] += ' '
+            collect_text(child, lines)
+
+
+class AdvicePageParser:
+    """Extract advice URLs and fields from the raw HTML of overview and detail pages, without a browser"""
+
+    def parse_overview_page(self, html, base_url):
+        """Extract the advice URLs of an overview page, looking only at the div.ipx-pt-advies entries"""
+        if lxml_html is not None:
+            hrefs = self.overview_hrefs_lxml(html)
+        else:
+            hrefs = self.overview_hrefs_soup(html)
+        logger.debug(f"Found {len(hrefs)} entries to process")
+
+        results = []
+        for i, (has_title, has_link, url) in enumerate(hrefs, 1):
+            if not has_title:
+                logger.warning(f"No title element found in entry {i}")
+            elif not has_link:
+                logger.warning(f"No link found in title element for entry {i}")
+            elif not url:
+                logger.warning(f"No URL found in link for entry {i}")
+            else:
+                results.append({
+                    'url': url if url.startswith('http') else f"{base_url}{url}",
+                })
+        return results
+
+    def overview_hrefs_lxml(self, html):
+        """Return (has_title, has_link, href) per entry, using lxml's C tree and class index"""
+        root = lxml_html.fromstring(html)
+        hrefs = []
+        for entry in root.find_class('ipx-pt-advies'):
+            if entry.tag != 'div':
+                continue
+            title_elem = next(entry.iter('h2'), None)
+            link = next(title_elem.iter('a'), None) if title_elem is not None else None
+            hrefs.append((title_elem is not None, link is not None, link.get('href') if link is not None else None))
+        return hrefs
+
+    def overview_hrefs_soup(self, html):
+        """Return (has_title, has_link, href) per entry, building a tree of only the entry divs"""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=OVERVIEW_ENTRIES)
+        hrefs = []
+        for entry in soup.find_all('div', class_='ipx-pt-advies'):
+            title_elem = entry.find('h2')
+            link = title_elem.find('a') if title_elem else None
+            hrefs.append((title_elem is not None, link is not None, link.get('href') if link else None))
+        return hrefs
+
+    def parse_advice_page(self, html):
+        """Parse a detail page and return the same fields as RaadVanStateScraper.get_advice_content"""
+        start_time = time.time()
+        advice = empty_advice()
+
+        if not html or len(html.strip()) == 0:
+            logger.error("Received empty HTML content")
+            return advice
+
+        soup = BeautifulSoup(html, 'html.parser')
+
+        content_div = soup.find(id='volledigetekst')
+        if content_div:
+            advice['content'] = element_text(content_div)
+        else:
+            logger.warning("Could not find content element 'volledigetekst'")
+
+        kenmerk_div = soup.find(class_='meta-value-kenmerk')
+        if kenmerk_div:
+            advice['reference'] = element_text(kenmerk_div)
+        else:
+            logger.warning("Could not find kenmerk")
+
+        keywords_ul = soup.find(class_='trefwoorden')
+        if keywords_ul:
+            for item in keywords_ul.find_all('li'):
+                advice_type = ADVICE_TYPES.get(item.get('title'))
+                if advice_type:
+                    advice['advice_type'] = advice_type
+                    break
+        else:
+            logger.warning("Could not find keywords")
+
+        found_dates = []
+        for element in soup.find_all(class_=list(DATE_CLASSES.keys())):
+            classes = element.get('class', [])
+            class_name = next((c for c in DATE_CLASSES if c in classes), None)
+            date_text = element_text(element)
+            if class_name and date_text:
+                advice[DATE_CLASSES[class_name]] = date_text
+                found_dates.append(class_name)
+
+        total_time = time.time() - start_time
+        logger.debug(f"Parsed advice page ({', '.join(found_dates) or 'no dates'}) in {total_time:.2f} seconds")
+        return advice
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract advice fields from saved detail page HTML')
+    parser.add_argument('html_files', nargs='+', help='Saved detail page HTML files')
+    parser.add_argument('--repeat', type=int, default=1, help='Parse each file this many times and report the timing')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    advice_parser = AdvicePageParser()
+
+    for html_file in args.html_files:
+        with open(html_file, encoding='utf-8') as f:
+            html = f.read()
+
+        start_time = time.perf_counter()
+        for _ in range(args.repeat):
+            advice = advice_parser.parse_advice_page(html)
+        per_parse = (time.perf_counter() - start_time) / args.repeat
+
+        summary = {key: value for key, value in advice.items() if key != 'content'}
+        summary['content_chars'] = len(advice['content'] or '')
+        print(json.dumps({'file': html_file, 'ms_per_parse': round(per_parse * 1000, 3), **summary}, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,138 @@ import pandas as pd
 import replicate
 import time
 import logging
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 import json
 import os
+import re
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from rate_limiter import AdaptiveRateLimiter
+from classification_cache import ClassificationCache, classification_key
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def _flex(s: str) -> str:
+    """Make spaces optional in a pattern string"""
+    return r'\s*'.join(s.split())
+
+
+# Parts shared by the standard dictum formulations
+_START = _flex("De Afdeling advisering van de Raad van State heeft")
+_PROPOSAL_VARS = r'(het\s+voorstel|de\s+ontwerpbesluiten|het\s+ontwerpbesluit)'
+_PROPOSAL_REF = r'(het\s+voorstel|deze|het)'
+_BIJ_OVER = r'(bij|over)'
+_BESLUIT_VARS = r'(het|een)\s+besluit'
+
+# What follows the common start of each standard dictum, by category; every category has a
+# Tweede Kamer variant and a besluit variant. Listed in the order they take precedence.
+DICTUM_VARIANTS = {
+    'A_kamer': rf'geen\s+opmerkingen\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_PROPOSAL_REF}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
+    'A_besluit': rf'geen\s+opmerkingen\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_BESLUIT_VARS}\s+te\s+nemen',
+    'B_kamer': rf'een\s+aantal\s+opmerkingen\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{_PROPOSAL_REF}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+(wordt|worden)\s+ingediend',
+    'B_besluit': rf'een\s+aantal\s+opmerkingen\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{_BESLUIT_VARS}\s+(wordt|worden)\s+genomen',
+    'C_kamer': rf'(een\s+aantal\s+)?bezwaren\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_PROPOSAL_REF}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast',
+    'C_besluit': rf'(een\s+aantal\s+)?bezwaren\s+{_BIJ_OVER}\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_BESLUIT_VARS}\s+niet\s+te\s+nemen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast',
+    'D_kamer': rf'ernstige\s+bezwaren\s+tegen\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_PROPOSAL_REF}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
+    'D_besluit': rf'ernstige\s+bezwaren\s+tegen\s+{_PROPOSAL_VARS}\s+en\s+adviseert\s+{_BESLUIT_VARS}\s+niet\s+te\s+nemen',
+}
+
+# All variants in one pattern, compiled once. At any position at most one variant can match,
+# so a single finditer pass finds every dictum in the text.
+DICTUM_PATTERN = re.compile(
+    rf"\b{_START}\s+(?:" + '|'.join(f'(?P<{name}>{variant})' for name, variant in DICTUM_VARIANTS.items()) + r")\b",
+    re.IGNORECASE
+)
+_DICTUM_PRECEDENCE = {name: i for i, name in enumerate(DICTUM_VARIANTS)}
+
+# Where a dictum can start; used to find the end section of an advice without normalizing all of it
+DICTUM_ANCHOR = re.compile(_flex("De Afdeling advisering"), re.IGNORECASE)
+
+
+def match_standard_dictum(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return (category, matched text) of the standard dictum in a text, or (None, None).
+
+    If several dictums occur, the category listed first in DICTUM_VARIANTS wins,
+    and within a variant its first occurrence.
+    """
+    return _match_normalized(' '.join(text.split()))
+
+
+def match_standard_dictum_tail(text: str, search_chars: int = 20000) -> Tuple[Optional[str], Optional[str]]:
+    """Like match_standard_dictum, but only normalize and scan the end of the text.
+
+    Every dictum starts with "De Afdeling advisering", so the window runs from
+    the first mention of it within the last search_chars characters to the
+    end. That gives the full scan's result whenever all dictums of a text lie
+    in that stretch; the whole text is scanned only if the window holds none.
+    """
+    anchor = DICTUM_ANCHOR.search(text, max(0, len(text) - search_chars))
+    if anchor:
+        # Keep the character before the anchor, so the word boundary check sees what the full scan sees
+        window = ' '.join(text[max(0, anchor.start() - 1):].split())
+        category, matched_text = _match_normalized(window)
+        if category:
+            return category, matched_text
+    return match_standard_dictum(text)
+
+
+def _match_normalized(text: str) -> Tuple[Optional[str], Optional[str]]:
+    best = None
+    for match in DICTUM_PATTERN.finditer(text):
+        name = match.lastgroup
+        if best is None or _DICTUM_PRECEDENCE[name] < _DICTUM_PRECEDENCE[best.lastgroup]:
+            best = match
+            if _DICTUM_PRECEDENCE[name] == 0:
+                break
+    if best is None:
+        return None, None
+    return best.lastgroup[0], best.group(0)
+
+
+# Error of rows that --regex-only could not classify; a normal run sends them to the LLM
+NEEDS_LLM = "No standard dictum found, needs LLM"
+
+RESULT_COLUMNS = ['url', 'reference', 'advice_type', 'category', 'error', 'reasoning']
+
+# Set in each worker process by _init_dictum_worker
+_dictum_analyzer = None
+
+
+def _init_dictum_worker(dictum_search: str) -> None:
+    global _dictum_analyzer
+    _dictum_analyzer = AdviceAnalyzer('', dictum_search=dictum_search, regex_only=True)
+
+
+def _check_dictum_chunk(contents: List) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Worker: check_standard_dictum for a chunk of advice texts"""
+    return [_dictum_analyzer.check_standard_dictum(content) if isinstance(content, str) and content else (None, None)
+            for content in contents]
+
+
 class AdviceAnalyzer:
-    def __init__(self, input_file: str, test_mode: bool = False):
+    def __init__(self, input_file: str, test_mode: bool = False, max_rate: float = 2.0,
+                 dictum_search: str = 'tail', regex_only: bool = False, processes: Optional[int] = None,
+                 cache_file: Optional[str] = None):
         self.input_file = input_file
         self.test_mode = test_mode
+        # 'tail' scans the end of an advice for the dictum first, 'full' always scans all of it
+        self.dictum_search = dictum_search
+        # Processes for the standard dictum checks of a file (None: one per CPU, 1: no pool)
+        self.processes = processes
         self.model = "meta/meta-llama-3.1-405b-instruct"
-
-        # Check for REPLICATE_API_TOKEN
-        if 'REPLICATE_API_TOKEN' not in os.environ:
+        self.generation = {"max_tokens": 1024, "temperature": 0.1}
+        # Earlier LLM classifications by content, valid while prompt and model are unchanged
+        self.cache = ClassificationCache(cache_file) if cache_file and not regex_only else None
+        self.version = self.classifier_version()
+        # Paces LLM calls, starting at the old one call per 2 seconds
+        self.rate_limiter = AdaptiveRateLimiter(rate=0.5, min_rate=0.05, max_rate=max_rate, name='replicate')
+
+        # Check for REPLICATE_API_TOKEN; the regex-only pass makes no LLM calls
+        if not regex_only and 'REPLICATE_API_TOKEN' not in os.environ:
             raise ValueError(
                 "REPLICATE_API_TOKEN not found. Please set it with:\n"
                 "export REPLICATE_API_TOKEN='your_token_here'\n"
@@ -27,6 +142,18 @@ class AdviceAnalyzer:
                 "set REPLICATE_API_TOKEN=your_token_here"
             )
 
+    def classifier_version(self) -> str:
+        """Model plus a hash of the prompt and generation settings; cached classifications are tied to it"""
+        settings = json.dumps({"prompt": self.create_prompt(""), **self.generation}, sort_keys=True)
+        return f"{self.model}:{hashlib.sha256(settings.encode('utf-8')).hexdigest()[:16]}"
+
+    def remember(self, key: Optional[str], result: Tuple[str, Optional[str], Optional[str]]
+                 ) -> Tuple[str, Optional[str], Optional[str]]:
+        """Store an LLM classification in the cache, if there is one, and return it"""
+        if key is not None:
+            self.cache.put(key, self.version, *result)
+        return result
+
     def truncate_text(self, text: str, max_chars: int = 6000) -> str:
         """Truncate text intelligently by looking for the dictum near the end"""
         if not text or len(text) <= max_chars:
@@ -107,97 +234,81 @@ Advies:
 
     def check_standard_dictum(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """Check for standard dictum formulations using regex"""
-        import re
-
-        # Helper function to make spaces flexible
-        def flex(s: str) -> str:
-            """Make spaces optional in a pattern string"""
-            return r'\s*'.join(s.split())
-
-        # Common starting phrase with flexible spaces
-        start = flex("De Afdeling advisering van de Raad van State heeft")
-
-        # Parts that can vary in multiple patterns
-        proposal_vars = r'(het\s+voorstel|de\s+ontwerpbesluiten|het\s+ontwerpbesluit)'
-        proposal_ref = r'(het\s+voorstel|deze|het)'
-        bij_over = r'(bij|over)'
-        besluit_vars = r'(het|een)\s+besluit'
-
-        # Define patterns with variations
-        patterns = {
-            'A': [
-                # Standard Tweede Kamer variant
-                rf'{start}\s+geen\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
-                # Besluit variant
-                rf'{start}\s+geen\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+te\s+nemen'
-            ],
-
-            'B': [
-                # Standard Tweede Kamer variant
-                rf'{start}\s+een\s+aantal\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{proposal_ref}\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+(wordt|worden)\s+ingediend',
-                # Besluit variant
-                rf'{start}\s+een\s+aantal\s+opmerkingen\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+daarmee\s+rekening\s+te\s+houden\s+voordat\s+{besluit_vars}\s+(wordt|worden)\s+genomen'
-            ],
-
-            'C': [
-                # Standard Tweede Kamer variant
-                rf'{start}\s+(een\s+aantal\s+)?bezwaren\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast',
-                # Besluit variant
-                rf'{start}\s+(een\s+aantal\s+)?bezwaren\s+{bij_over}\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+niet\s+te\s+nemen,\s*tenzij\s+(het|deze)\s+(is|zijn)\s+aangepast'
-            ],
-
-            'D': [
-                # Standard Tweede Kamer variant
-                rf'{start}\s+ernstige\s+bezwaren\s+tegen\s+{proposal_vars}\s+en\s+adviseert\s+{proposal_ref}\s+niet\s+bij\s+de\s+Tweede\s+Kamer\s+der\s+Staten-Generaal\s+in\s+te\s+dienen',
-                # Besluit variant
-                rf'{start}\s+ernstige\s+bezwaren\s+tegen\s+{proposal_vars}\s+en\s+adviseert\s+{besluit_vars}\s+niet\s+te\s+nemen'
-            ]
-        }
-
-        # Normalize spaces in input text
-        text = ' '.join(text.split())
-
-        # Check each pattern
-        for category, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                # Add word boundaries where appropriate
-                pattern = rf"\b{pattern}\b"
-                matches = re.search(pattern, text, re.IGNORECASE)
-                if matches:
-                    matched_text = matches.group(0)
-                    return category, f"Found standard dictum category {category}. Matched text: {matched_text}"
-
+        if self.dictum_search == 'tail':
+            category, matched_text = match_standard_dictum_tail(text)
+        else:
+            category, matched_text = match_standard_dictum(text)
+        if category:
+            return category, f"Found standard dictum category {category}. Matched text: {matched_text}"
         return None, None
 
-    def analyze_advice(self, content: str) -> Tuple[str, Optional[str], Optional[str]]:
-        """Analyze a single advice text and return the category, error, and reasoning"""
+    def check_standard_dictums(self, contents: List, processes: Optional[int] = None,
+                               chunk_size: int = 200) -> List[Tuple[Optional[str], Optional[str]]]:
+        """check_standard_dictum for many advice texts at once, in input order.
+
+        The texts are split into chunks that are checked in a process pool;
+        only the strings are sent to the workers. Empty or missing contents
+        give (None, None). With processes=1 everything runs in this process.
+        """
+        if processes == 1:
+            return [self.check_standard_dictum(content) if isinstance(content, str) and content else (None, None)
+                    for content in contents]
+        chunks = [contents[i:i + chunk_size] for i in range(0, len(contents), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_dictum_worker,
+                                 initargs=(self.dictum_search,)) as executor:
+            for chunk_results in executor.map(_check_dictum_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def analyze_advice(self, content: str, dictum: Optional[Tuple[Optional[str], Optional[str]]] = None
+                       ) -> Tuple[str, Optional[str], Optional[str]]:
+        """Analyze a single advice text and return the category, error, and reasoning
+
+        dictum is the result of check_standard_dictum for the text, if already known.
+        """
         if not content or pd.isna(content):
             return "G", "Empty or NaN content", None
 
         try:
             # First try to find standard dictum using regex
-            category, reasoning = self.check_standard_dictum(content)
+            category, reasoning = dictum if dictum is not None else self.check_standard_dictum(content)
             if category:
                 # If we find a standard pattern, return it with no error and the regex match explanation
                 logger.info(f"Found standard pattern {category} - skipping LLM")
                 return category, None, f"Regex match: {reasoning}"
 
+            # Then for an earlier LLM classification of the same text
+            cache_key = None
+            if self.cache is not None:
+                cache_key = classification_key(content, self.version)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Found cached classification {cached[0]} - skipping LLM")
+                    return cached
+
             # If no standard dictum found, use language model
             logger.info("No standard pattern found, using LLM")
             truncated_content = self.truncate_text(content)
 
             input_data = {
                 "prompt": self.create_prompt(truncated_content),
-                "max_tokens": 1024,
-                "temperature": 0.1
+                **self.generation
             }
 
             result = ""
-            for event in replicate.stream(
-                self.model,
-                input=input_data
-            ):
-                result += str(event)
+            self.rate_limiter.acquire()
+            request_start = time.time()
+            try:
+                for event in replicate.stream(
+                    self.model,
+                    input=input_data
+                ):
+                    result += str(event)
+            except Exception as e:
+                self.rate_limiter.record(time.time() - request_start, ok=False, status=getattr(e, 'status', None))
+                raise
+            self.rate_limiter.record(time.time() - request_start)
 
             # Parse JSON response
             try:
@@ -216,9 +327,9 @@ Advies:
                         return "G", f"Invalid category in response: {category}", None
 
                     if confidence < 0.7:  # If model is not confident enough
-                        return category, f"Low confidence: {confidence}", reasoning
+                        return self.remember(cache_key, (category, f"Low confidence: {confidence}", reasoning))
 
-                    return category, None, reasoning
+                    return self.remember(cache_key, (category, None, reasoning))
                 else:
                     return "G", f"Could not find JSON in response: {result}", None
 
@@ -238,7 +349,7 @@ Advies:
 
             # If file doesn't exist, create it with headers
             if not os.path.exists(output_file):
-                pd.DataFrame([row_data], columns=['url', 'reference', 'advice_type', 'category', 'error', 'reasoning']).to_csv(output_file, index=False)
+                pd.DataFrame([row_data], columns=RESULT_COLUMNS).to_csv(output_file, index=False)
             else:
                 # Append without headers
                 pd.DataFrame([row_data]).to_csv(output_file, mode='a', header=False, index=False)
@@ -253,6 +364,8 @@ Advies:
         if os.path.exists(output_file):
             try:
                 completed_df = pd.read_csv(output_file)
+                # Rows flagged by --regex-only still need the LLM
+                completed_df = completed_df[completed_df['error'] != NEEDS_LLM]
                 return set(completed_df['reference'].astype(str))
             except Exception as e:
                 logger.error(f"Error reading completed results: {str(e)}")
@@ -273,6 +386,17 @@ Advies:
                 df = df.head(10)
                 logger.info("Test mode: processing first 10 rows only")
 
+            # Check all pending rows for a standard dictum up front, in parallel
+            pending = [idx for idx, row in df.iterrows()
+                       if idx >= start_row and str(row['reference']) not in completed_refs]
+            dictums = {}
+            if self.processes != 1 and pending:
+                checked = self.check_standard_dictums(df.loc[pending, 'content'].tolist(), self.processes)
+                # Misses are kept too (as (None, None)), so analyze_advice does not check those texts again
+                dictums = dict(zip(pending, checked))
+                found = sum(1 for category, _ in checked if category)
+                logger.info(f"Found a standard dictum in {found} of {len(pending)} advices to analyze")
+
             # Process each row
             for idx, row in df.iterrows():
                 # Skip rows before start_row
@@ -286,7 +410,7 @@ Advies:
 
                 logger.info(f"Processing advice {idx + 1}/{len(df)} - {row['reference']}")
                 try:
-                    category, error, reasoning = self.analyze_advice(row['content'])
+                    category, error, reasoning = self.analyze_advice(row['content'], dictums.get(idx))
 
                     # Create result dictionary
                     result = {
@@ -312,22 +436,113 @@ Advies:
                     }
                     self.save_single_result(result)
 
-                # Add delay to respect rate limits
-                time.sleep(2)
+            logger.info(f"Rate limiter {self.rate_limiter.summary()}")
+            if self.cache is not None:
+                logger.info(f"Classification cache: {self.cache.summary()}")
+            self.drop_resolved_flags()
 
         except Exception as e:
             logger.error(f"Error processing file: {str(e)}")
             raise
 
+    def drop_resolved_flags(self) -> None:
+        """Remove rows flagged by --regex-only whose reference has since been analyzed by the LLM"""
+        output_file = self.input_file.replace('.csv', '_analyzed.csv')
+        if not os.path.exists(output_file):
+            return
+        df = pd.read_csv(output_file)
+        flagged = df['error'] == NEEDS_LLM
+        resolved = set(df.loc[~flagged, 'reference'].astype(str))
+        drop = flagged & df['reference'].astype(str).isin(resolved)
+        if drop.any():
+            df[~drop].to_csv(output_file, index=False)
+            logger.info(f"Removed {drop.sum()} flags of advices the LLM has analyzed since")
+
+    def process_file_regex_only(self) -> None:
+        """Classify every row with the standard dictum regexes alone and write all results at once.
+
+        The contents are checked in a process pool by check_standard_dictums.
+        Rows without a standard dictum are flagged with NEEDS_LLM, so a normal
+        run picks them up; earlier LLM results for them are kept. The results
+        are merged into an existing output file: its rows for other advices
+        (e.g. beyond the first 10 with --test) and its extra columns (e.g.
+        datum_advies_formatted) are kept.
+        """
+        start_time = time.time()
+        output_file = self.input_file.replace('.csv', '_analyzed.csv')
+        df = pd.read_csv(self.input_file)
+        if self.test_mode:
+            df = df.head(10)
+            logger.info("Test mode: processing first 10 rows only")
+        logger.info(f"Classifying {len(df)} rows of {self.input_file} with the standard dictum regexes")
+
+        results = []
+        for content, (category, reasoning) in zip(df['content'], self.check_standard_dictums(df['content'].tolist(),
+                                                                                             self.processes)):
+            if not isinstance(content, str) or not content:
+                results.append(("G", "Empty or NaN content", None))
+            elif category:
+                results.append((category, None, f"Regex match: {reasoning}"))
+            else:
+                results.append((None, NEEDS_LLM, None))
+        analyzed = pd.DataFrame(results, columns=['category', 'error', 'reasoning'], dtype=object)
+        analyzed.insert(0, 'url', df['url'].values)
+        analyzed.insert(1, 'reference', df['reference'].values)
+        analyzed.insert(2, 'advice_type', df['advice_type'].values if 'advice_type' in df.columns else None)
+
+        if os.path.exists(output_file):
+            previous_rows = pd.read_csv(output_file)
+            previous = previous_rows.drop_duplicates('reference', keep='last')
+            previous.index = previous['reference'].astype(str)
+            references = analyzed['reference'].astype(str)
+            # Keep what the LLM decided for advices the regexes still cannot classify
+            llm_done = previous[(previous['error'] != NEEDS_LLM)
+                                & ~previous['reasoning'].fillna('').str.startswith('Regex match')]
+            keep = (analyzed['error'] == NEEDS_LLM) & references.isin(llm_done.index)
+            for column in ['category', 'error', 'reasoning']:
+                analyzed.loc[keep, column] = references[keep].map(llm_done[column])
+            for column in previous.columns.difference(analyzed.columns):
+                analyzed[column] = references.map(previous[column])
+            # Rows this run did not classify (e.g. with --test) stay as they were
+            others = previous_rows[~previous_rows['reference'].astype(str).isin(references)]
+            analyzed = pd.concat([analyzed, others], ignore_index=True)
+
+        tmp_file = f"{output_file}.tmp"
+        analyzed.to_csv(tmp_file, index=False)
+        os.replace(tmp_file, output_file)
+
+        counts = analyzed['category'].fillna('none').value_counts().sort_index()
+        flagged = (analyzed['error'] == NEEDS_LLM).sum()
+        logger.info(f"Classified {len(df)} rows, wrote {len(analyzed)} rows to {output_file} in {time.time() - start_time:.2f} seconds: "
+                    f"{', '.join(f'{category}: {n}' for category, n in counts.items())}; "
+                    f"{flagged} flagged for the LLM")
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Analyze Raad van State advices')
     parser.add_argument('input_file', help='Input CSV file with advices')
     parser.add_argument('--test', action='store_true', help='Run in test mode (only 10 advices)')
     parser.add_argument('--start-row', type=int, default=0, help='Start processing from this row number')
+    parser.add_argument('--max-rate', type=float, default=2.0,
+                        help='Upper bound in LLM calls/second for the adaptive rate limiter (it starts at 0.5)')
+    parser.add_argument('--dictum-search', choices=['tail', 'full'], default='tail',
+                        help='Look for the standard dictum at the end of an advice first, or always in all of it')
+    parser.add_argument('--regex-only', action='store_true',
+                        help='Classify all rows with the standard dictum regexes only, flagging the rest for the LLM')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='Processes for the standard dictum checks (default: one per CPU; 1: no process pool)')
+    parser.add_argument('--cache-file', default='classification_cache.sqlite',
+                        help='SQLite file with earlier LLM classifications by content (default: classification_cache.sqlite)')
+    parser.add_argument('--no-cache', action='store_true', help='Always ask the LLM, without reading or filling the cache')
     args = parser.parse_args()
 
-    analyzer = AdviceAnalyzer(args.input_file, test_mode=args.test)
+    analyzer = AdviceAnalyzer(args.input_file, test_mode=args.test, max_rate=args.max_rate,
+                              dictum_search=args.dictum_search, regex_only=args.regex_only,
+                              processes=args.processes, cache_file=None if args.no_cache else args.cache_file)
+
+    if args.regex_only:
+        analyzer.process_file_regex_only()
+        return
 
     try:
         analyzer.process_file(start_row=args.start_row)
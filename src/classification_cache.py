@@ -0,0 +1,61 @@
+import time
+import hashlib
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS classifications (
+    key TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    error TEXT,
+    reasoning TEXT,
+    version TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def classification_key(content, version):
+    """SHA-256 over the whitespace-normalized advice text and the classifier version"""
+    return hashlib.sha256(f"{' '.join(content.split())}\x1f{version}".encode('utf-8')).hexdigest()
+
+
+class ClassificationCache:
+    """Persistent cache of LLM classifications of advice texts, kept in a SQLite database.
+
+    Entries are keyed by classification_key, so an advice whose text is
+    identical to one classified before (in another file, a re-scraped year
+    or a test run) gets its earlier category, error and reasoning back,
+    as long as the prompt and model, which make up the version, are the same.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.db = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.db.close()
+
+    def get(self, key):
+        """Return the cached (category, error, reasoning) for a key, or None"""
+        row = self.db.execute('SELECT category, error, reasoning FROM classifications WHERE key = ?',
+                              (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tuple(row)
+
+    def put(self, key, version, category, error, reasoning):
+        self.db.execute('INSERT OR REPLACE INTO classifications VALUES (?, ?, ?, ?, ?, ?)',
+                        (key, category, error, reasoning, version, time.time()))
+
+    def summary(self):
+        size = self.db.execute('SELECT COUNT(*) FROM classifications').fetchone()[0]
+        return f"{self.hits} hits, {self.misses} misses, {size} classifications in {self.db_path}"
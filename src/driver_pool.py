@@ -0,0 +1,69 @@
+import time
+import queue
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """A fixed set of headless Chrome drivers that fetch advice pages in parallel"""
+
+    def __init__(self, scraper, size, max_retries=2):
+        start_time = time.time()
+        self.scraper = scraper
+        self.size = size
+        self.max_retries = max_retries
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='driver')
+        self.drivers = queue.Queue()
+
+        # Chrome start-up takes seconds, so start all drivers at the same time
+        for driver in self.executor.map(lambda _: scraper.create_driver(), range(size)):
+            self.drivers.put(driver)
+
+        logger.info(f"Started pool of {size} Chrome drivers in {time.time() - start_time:.2f} seconds")
+
+    def is_alive(self, driver):
+        """Check whether a driver still responds"""
+        try:
+            driver.title
+            return True
+        except Exception:
+            return False
+
+    def replace(self, driver):
+        """Quit a broken driver and start a fresh one in its place"""
+        logger.warning("Chrome driver stopped responding, starting a new one")
+        return self.scraper.recycle_driver(driver)
+
+    def fetch(self, url):
+        """Fetch one advice on a free driver, retrying failures on that same driver"""
+        driver = self.drivers.get()
+        try:
+            if self.scraper.needs_recycling(driver):
+                driver = self.scraper.recycle_driver(driver)
+            for attempt in range(self.max_retries + 1):
+                advice = self.scraper.get_advice_content(url, driver=driver)
+                if advice['content'] is not None:
+                    return advice
+
+                logger.warning(f"Attempt {attempt + 1} for {url} returned no content")
+                if attempt < self.max_retries:
+                    self.scraper.metrics.increment('retries', 'detail')
+                # Pacing between attempts comes from the scraper's rate limiter
+                if not self.is_alive(driver):
+                    driver = self.replace(driver)
+            logger.error(f"Giving up on {url} after {self.max_retries + 1} attempts")
+            return advice
+        finally:
+            self.drivers.put(driver)
+
+    def fetch_all(self, urls):
+        """Fetch all advices in parallel; the returned iterator yields them in input order"""
+        return self.executor.map(self.fetch, urls)
+
+    def close(self):
+        """Quit every driver in the pool"""
+        self.executor.shutdown(wait=True)
+        while not self.drivers.empty():
+            self.drivers.get().quit()
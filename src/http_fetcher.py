@@ -0,0 +1,122 @@
+import asyncio
+import time
+import logging
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+class HttpFetcher:
+    """Fetch pages over plain HTTP with a bounded number of concurrent requests.
+
+    With a PageCache, fresh cached pages are served from disk and stale ones
+    are revalidated with a conditional request.
+    """
+
+    def __init__(self, concurrency=8, timeout=30, max_retries=3, cache=None, rate_limiter=None, metrics=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+
+    def record(self, request_start, **kwargs):
+        """Report a finished request to the rate limiter and metrics, if there are any"""
+        latency = time.time() - request_start
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(latency, **kwargs)
+        if self.metrics is not None:
+            self.metrics.observe('http_request', latency)
+            self.metrics.increment('http_requests', 'ok' if kwargs.get('ok', True) else 'error')
+
+    async def _fetch(self, session, semaphore, url, cached=None, kind='detail'):
+        """Fetch a single URL, retrying with exponential backoff. Returns None on failure."""
+        headers = {}
+        if cached is not None:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(self.max_retries):
+            start_time = time.time()
+            request_start = start_time
+            try:
+                async with semaphore:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async()
+                    request_start = time.time()
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and cached is not None:
+                            self.record(request_start, kind=kind)
+                            logger.debug(f"{url} not modified, using cached copy")
+                            self.cache.refresh(url)
+                            return cached['html']
+                        if response.status >= 400:
+                            retry_after = response.headers.get('Retry-After', '')
+                            self.record(request_start, ok=False, status=response.status, kind=kind,
+                                        retry_after=int(retry_after) if retry_after.isdigit() else None)
+                        response.raise_for_status()
+                        html = await response.text()
+                        self.record(request_start, kind=kind)
+                        if self.cache is not None:
+                            self.cache.put(url, html, response.headers.get('ETag'),
+                                           response.headers.get('Last-Modified'))
+                logger.debug(f"Fetched {url} in {time.time() - start_time:.2f} seconds")
+                return html
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    self.record(request_start, ok=False, kind=kind)
+                retry_time = time.time() - start_time
+                logger.error(f"Attempt {attempt + 1} for {url} failed after {retry_time:.2f} seconds: {e}")
+                if self.metrics is not None and attempt < self.max_retries - 1:
+                    self.metrics.increment('retries', 'http')
+                # The rate limiter already slows down after failures; back off by hand without one
+                if attempt < self.max_retries - 1 and self.rate_limiter is None:
+                    await asyncio.sleep(2 ** attempt)
+        return None
+
+    async def _fetch_all(self, urls, cached, kind):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT}, timeout=timeout) as session:
+            return await asyncio.gather(*(self._fetch(session, semaphore, url, cached.get(url), kind) for url in urls))
+
+    def fetch_all(self, urls, kind='detail'):
+        """Fetch all URLs concurrently and return their HTML in input order (None for failures).
+
+        kind ('overview' or 'detail') picks the cache ttl and the rate limiter's latency baseline.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+
+        start_time = time.time()
+        results = {}
+        cached = {}
+        if self.cache is not None:
+            for url in urls:
+                entry = self.cache.get(url, kind)
+                if entry is None:
+                    continue
+                if entry['fresh']:
+                    results[url] = entry['html']
+                else:
+                    cached[url] = entry
+
+        to_fetch = [url for url in urls if url not in results]
+        if to_fetch:
+            results.update(zip(to_fetch, asyncio.run(self._fetch_all(to_fetch, cached, kind))))
+
+        total_time = time.time() - start_time
+        failed = sum(1 for url in urls if results[url] is None)
+        logger.info(f"Fetched {len(urls) - failed}/{len(urls)} pages ({len(urls) - len(to_fetch)} from cache) "
+                    f"in {total_time:.2f} seconds")
+        return [results[url] for url in urls]
+
+    def fetch(self, url, kind='detail'):
+        """Fetch a single URL"""
+        return self.fetch_all([url], kind)[0]
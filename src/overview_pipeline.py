@@ -0,0 +1,80 @@
+import time
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class OverviewProducer:
+    """Harvest overview pages in a background thread, ahead of the detail fetchers.
+
+    Pages are handed over through a bounded queue, so the producer never runs
+    more than max_pages_ahead pages in front of the consumer.
+    """
+
+    def __init__(self, scraper, max_pages_ahead=2):
+        self.scraper = scraper
+        self.queue = queue.Queue(maxsize=max_pages_ahead)
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='overview-producer', daemon=True)
+        self.thread.start()
+
+    def put(self, item):
+        """Put an item on the queue, giving up when the consumer has stopped"""
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self):
+        scraper = self.scraper
+        driver = None
+        owns_driver = False
+
+        # Detail pages use the pool or the main driver; the producer needs one of its own
+        if scraper.backend == 'selenium':
+            if scraper.pool is not None:
+                driver = scraper.driver
+            else:
+                driver = scraper.create_driver()
+                owns_driver = True
+
+        page = scraper.start_page
+        try:
+            while not self.stop_event.is_set():
+                page_start = time.time()
+                page_results = scraper.overview_results(page, driver=driver)
+                logger.info(f"Prefetched overview page {page + 1} in {time.time() - page_start:.2f} seconds")
+
+                if not self.put((page, page_results)):
+                    break
+                if not page_results or len(page_results) < scraper.batch_size:
+                    break
+                page += 1
+        except Exception as e:
+            logger.error(f"Error prefetching overview page {page + 1}: {e}")
+            self.put(e)
+        finally:
+            self.put(_DONE)
+            if owns_driver:
+                driver.quit()
+
+    def __iter__(self):
+        while True:
+            item = self.queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def close(self):
+        """Stop harvesting and wait for the producer thread to finish"""
+        self.stop_event.set()
+        self.thread.join()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+import os
+import zlib
+import gzip
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.contextmanager
+def locked_file(path):
+    """Hold an exclusive lock on a lock file, waiting for other processes that hold it"""
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            yield f
+            return
+        # msvcrt locks a byte range from the current position; LK_LOCK gives up after 10 attempts
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+        try:
+            yield f
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class PageArchive:
+    """Append-only archive of the raw HTML of every fetched page, per year.
+
+    Each page is one JSON record (url, year, kind, fetched_at, sha1, html)
+    compressed as its own gzip member and appended to the year's current
+    segment file, <archive_dir>/<year>/<year>-00000.jsonl.gz and so on. As
+    with WARC.gz files, the segments are ordinary gzip files that zcat can
+    read, while a single record can be decompressed on its own given its
+    offset and length. Those are kept in an append-only index.jsonl per
+    year, so any page can be read back by URL without scanning the
+    segments. Pages identical to their last archived copy are not stored
+    again; a changed page is appended and becomes the indexed version.
+    """
+
+    def __init__(self, archive_dir, max_segment_bytes=512 * 1024 ** 2):
+        self.archive_dir = archive_dir
+        self.max_segment_bytes = max_segment_bytes
+        self.lock = threading.Lock()
+        # Per year: url -> latest index entry, and how far index.jsonl has been read
+        self.indexes = {}
+        self.index_offsets = {}
+        self.pages_written = 0
+        self.bytes_written = 0
+        os.makedirs(archive_dir, exist_ok=True)
+
+    def year_dir(self, year):
+        return os.path.join(self.archive_dir, str(year))
+
+    def segment_path(self, year, segment):
+        return os.path.join(self.year_dir(year), f"{year}-{segment:05d}.jsonl.gz")
+
+    def years(self):
+        """Years that have an archive"""
+        return sorted(name for name in os.listdir(self.archive_dir)
+                      if os.path.isfile(os.path.join(self.archive_dir, name, 'index.jsonl')))
+
+    def load_index(self, year):
+        """Read index entries of a year added since the last call, also by other processes"""
+        year = str(year)
+        index = self.indexes.setdefault(year, {})
+        index_path = os.path.join(self.year_dir(year), 'index.jsonl')
+        if not os.path.exists(index_path):
+            return index
+        with open(index_path, 'rb') as f:
+            f.seek(self.index_offsets.get(year, 0))
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Being written by another process; read it next time
+                entry = json.loads(line)
+                index[entry['url']] = entry
+                self.index_offsets[year] = f.tell()
+        return index
+
+    def put(self, year, url, html, kind='detail'):
+        """Archive a page; returns False if the same HTML is already archived for this URL"""
+        if not html:
+            return False
+        year = str(year)
+        sha1 = hashlib.sha1(html.encode('utf-8')).hexdigest()
+        record = {'url': url, 'year': year, 'kind': kind, 'fetched_at': time.time(), 'sha1': sha1, 'html': html}
+        data = gzip.compress(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n', compresslevel=6)
+
+        year_dir = self.year_dir(year)
+        os.makedirs(year_dir, exist_ok=True)
+        # Other processes may archive the same year, e.g. frontier workers
+        with self.lock, locked_file(os.path.join(year_dir, '.lock')):
+            index = self.load_index(year)
+            previous = index.get(url)
+            if previous is not None and previous['sha1'] == sha1:
+                return False
+
+            segment = max((entry['segment'] for entry in index.values()), default=0)
+            segment_path = self.segment_path(year, segment)
+            if os.path.exists(segment_path) and os.path.getsize(segment_path) >= self.max_segment_bytes:
+                segment += 1
+                segment_path = self.segment_path(year, segment)
+            with open(segment_path, 'ab') as f:
+                offset = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            entry = {'url': url, 'segment': segment, 'offset': offset, 'length': len(data),
+                     'sha1': sha1, 'kind': kind, 'fetched_at': record['fetched_at']}
+            with open(os.path.join(year_dir, 'index.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self.load_index(year)
+            self.pages_written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def read(self, year, entry):
+        """Read the record an index entry points to"""
+        with open(self.segment_path(year, entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            return json.loads(gzip.decompress(f.read(entry['length'])))
+
+    def get(self, url, year=None):
+        """Return the latest archived record for a URL, or None"""
+        for candidate in ([str(year)] if year is not None else self.years()):
+            entry = self.load_index(candidate).get(url)
+            if entry is not None:
+                return self.read(candidate, entry)
+        return None
+
+    def entries(self, year, kind=None):
+        """Latest index entry of every archived URL of a year, optionally of one kind, in file order"""
+        entries = self.load_index(year).values()
+        if kind is not None:
+            entries = [entry for entry in entries if entry['kind'] == kind]
+        return sorted(entries, key=lambda entry: (entry['segment'], entry['offset']))
+
+    def rebuild_index(self, year):
+        """Recreate a year's index by scanning its segments, e.g. after the index file was lost"""
+        year = str(year)
+        year_dir = self.year_dir(year)
+        segments = sorted(name for name in os.listdir(year_dir) if name.endswith('.jsonl.gz'))
+        entries = []
+        for name in segments:
+            segment = int(name[len(year) + 1:-len('.jsonl.gz')])
+            with open(os.path.join(year_dir, name), 'rb') as f:
+                data = f.read()
+            offset = 0
+            while offset < len(data):
+                # Each record is its own gzip member; the decompressor stops at its end
+                decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+                try:
+                    record = json.loads(decompressor.decompress(data[offset:]))
+                except (zlib.error, ValueError) as e:
+                    logger.warning(f"Stopping at damaged record in {name} at offset {offset}: {e}")
+                    break
+                length = len(data) - offset - len(decompressor.unused_data)
+                entries.append({'url': record['url'], 'segment': segment, 'offset': offset, 'length': length,
+                                'sha1': record['sha1'], 'kind': record['kind'], 'fetched_at': record['fetched_at']})
+                offset += length
+
+        tmp_path = os.path.join(year_dir, 'index.jsonl.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        os.replace(tmp_path, os.path.join(year_dir, 'index.jsonl'))
+        self.indexes.pop(year, None)
+        self.index_offsets.pop(year, None)
+        logger.info(f"Rebuilt index of {year} from {len(segments)} segments: {len(entries)} records")
+        return len(entries)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Inspect the archive of raw scraped pages')
+    parser.add_argument('--archive-dir', default='page_archive', help='Archive directory (default: page_archive)')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    subparsers.add_parser('list', help='Show the number of archived pages per year')
+    get = subparsers.add_parser('get', help='Print the archived HTML of a URL')
+    get.add_argument('url')
+    get.add_argument('--year', type=str, help='Year the URL was scraped for (default: search all years)')
+    rebuild = subparsers.add_parser('rebuild-index', help="Recreate a year's index from its segment files")
+    rebuild.add_argument('year')
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive_dir)
+    if args.action == 'list':
+        for year in archive.years():
+            entries = archive.entries(year)
+            details = sum(1 for entry in entries if entry['kind'] == 'detail')
+            print(f"{year}: {details} detail pages, {len(entries) - details} overview pages")
+    elif args.action == 'get':
+        record = archive.get(args.url, args.year)
+        if record is None:
+            raise SystemExit(f"{args.url} is not archived")
+        print(record['html'])
+    else:
+        archive.rebuild_index(args.year)
+
+if __name__ == "__main__":
+    main()
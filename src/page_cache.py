@@ -0,0 +1,124 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """Persistent on-disk cache of fetched pages, keyed by a hash of the URL.
+
+    Each page is stored as a gzipped JSON file holding the HTML and the HTTP
+    validators (ETag, Last-Modified), so stale pages can be revalidated with a
+    conditional request. Entries older than ttl seconds are stale (ttl None
+    means they never expire); ttls overrides it per kind of page, e.g.
+    {'detail': None}. When the cache grows beyond max_bytes, the least
+    recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir, ttl=None, max_bytes=2 * 1024 ** 3, ttls=None):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(size for _, size, _ in self.entries())
+        logger.info(f"Page cache at {cache_dir}: {self.total_bytes / 1024 ** 2:.1f} MB, "
+                    f"ttl {'none' if ttl is None else f'{ttl:.0f} seconds'}")
+
+    def path(self, url):
+        """Location of a URL's cache entry, sharded by the first two hex digits of its hash"""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def entries(self):
+        """Yield (path, size, last_used) for every cache entry"""
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.json.gz'):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def get(self, url, kind=None):
+        """Return the cached entry for a URL (html, etag, last_modified, fetched_at, fresh) or None.
+
+        Freshness uses the ttl of the page's kind if ttls has one.
+        """
+        path = self.path(url)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+            # The file's mtime tracks last use for LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            self.misses += 1
+            return None
+
+        ttl = self.ttls.get(kind, self.ttl)
+        entry['fresh'] = ttl is None or time.time() - entry['fetched_at'] <= ttl
+        if entry['fresh']:
+            self.hits += 1
+        return entry
+
+    def put(self, url, html, etag=None, last_modified=None):
+        """Store a fetched page"""
+        path = self.path(url)
+        entry = {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'html': html
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            new_size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+            return
+
+        with self.lock:
+            self.total_bytes += new_size - old_size
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+
+    def refresh(self, url):
+        """Mark a stale entry as fresh again after the server confirmed it is unchanged"""
+        entry = self.get(url)
+        if entry is not None:
+            self.put(url, entry['html'], entry['etag'], entry['last_modified'])
+
+    def evict(self):
+        """Remove least recently used entries until the cache is below 90% of its size cap"""
+        start_time = time.time()
+        target = self.max_bytes * 0.9
+        removed = 0
+        for path, size, _ in sorted(self.entries(), key=lambda entry: entry[2]):
+            if self.total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.total_bytes -= size
+            removed += 1
+        logger.info(f"Evicted {removed} cache entries in {time.time() - start_time:.2f} seconds")
@@ -0,0 +1,97 @@
+import time
+import logging
+import threading
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+# How driver.get() returns for each strategy: after the load event, after DOMContentLoaded, ...
+PAGE_LOAD_STRATEGIES = {
+    'load': 'normal',
+    'dom-ready': 'eager',
+    'network-idle': 'eager'
+}
+
+NETWORK_STATE_SCRIPT = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+
+class PageReadiness:
+    """Decide when a freshly loaded page can be read, and measure how long that took.
+
+    Strategies:
+        load          driver.get() waits for the load event, then the required element is awaited
+        dom-ready     driver.get() returns at DOMContentLoaded, then the required element is awaited
+        network-idle  as dom-ready, then also waits until no new sub-resources were requested for idle_time
+    Each page kind has its own budget in seconds for the required element.
+    """
+
+    def __init__(self, strategy='load', budgets=None, idle_time=0.5, poll_frequency=0.05, metrics=None):
+        if strategy not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Unknown readiness strategy: {strategy}")
+        self.strategy = strategy
+        self.budgets = {'overview': 2.0, 'detail': 2.0, **(budgets or {})}
+        self.idle_time = idle_time
+        self.poll_frequency = poll_frequency
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.wait_times = {kind: [] for kind in self.budgets}
+        self.timeouts = {kind: 0 for kind in self.budgets}
+
+    @property
+    def page_load_strategy(self):
+        """Value for ChromeOptions.page_load_strategy"""
+        return PAGE_LOAD_STRATEGIES[self.strategy]
+
+    def network_idle(self):
+        """Condition that holds once the document is complete and no resources were added for idle_time"""
+        state = {'count': None, 'since': time.time()}
+
+        def condition(driver):
+            ready_state, count = driver.execute_script(NETWORK_STATE_SCRIPT)
+            now = time.time()
+            if count != state['count']:
+                state['count'], state['since'] = count, now
+                return False
+            return ready_state == 'complete' and now - state['since'] >= self.idle_time
+
+        return condition
+
+    def wait(self, driver, kind, locator):
+        """Wait until the page is ready; returns (ready, seconds waited)"""
+        budget = self.budgets[kind]
+        wait_start = time.time()
+        ready = True
+        try:
+            wait = WebDriverWait(driver, budget, poll_frequency=self.poll_frequency)
+            wait.until(EC.presence_of_element_located(locator))
+            if self.strategy == 'network-idle':
+                remaining = max(budget - (time.time() - wait_start), self.poll_frequency)
+                WebDriverWait(driver, remaining, poll_frequency=self.poll_frequency).until(self.network_idle())
+        except TimeoutException:
+            ready = False
+
+        waited = time.time() - wait_start
+        with self.lock:
+            self.wait_times[kind].append(waited)
+            if not ready:
+                self.timeouts[kind] += 1
+        if self.metrics is not None:
+            self.metrics.observe(f'{kind}_wait', waited)
+            if not ready:
+                self.metrics.increment('timeouts', kind)
+        if ready:
+            logger.debug(f"{kind.capitalize()} page ready ({self.strategy}) after {waited:.2f} seconds")
+        else:
+            logger.warning(f"{kind.capitalize()} page not ready ({self.strategy}) within its {budget:.1f} second budget")
+        return ready, waited
+
+    def summary(self):
+        """Per page kind: average and maximum wait and number of timeouts"""
+        parts = []
+        for kind, times in self.wait_times.items():
+            if times:
+                parts.append(f"{kind} {sum(times) / len(times):.2f}s avg / {max(times):.2f}s max wait, "
+                             f"{self.timeouts[kind]} timeouts over {len(times)} pages")
+        return f"Page readiness ({self.strategy}): {'; '.join(parts) or 'no pages'}"
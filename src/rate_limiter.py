@@ -0,0 +1,109 @@
+import time
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to the server with AIMD.
+
+    Every successful request raises the rate additively (by about `increase`
+    requests/second per second of traffic). An error, a 429 response or a
+    latency far above the observed baseline (latency_factor times it, and at
+    least latency_margin seconds more, so jitter on fast responses does not
+    count) cuts the rate multiplicatively, at most once per cooldown. A Retry-After value pauses all requests.
+    The baseline is a slow moving average of every successful response, slow
+    ones included, so it follows a lasting change in latency instead of
+    cutting the rate down to min_rate. Each kind of page (overview, detail)
+    keeps its own baseline, as their latencies differ.
+    Thread-safe; usable from threads (acquire) and asyncio (acquire_async).
+    """
+
+    def __init__(self, rate=1.0, min_rate=0.1, max_rate=8.0, burst=1.0, increase=0.1,
+                 decrease=0.5, latency_factor=3.0, latency_margin=0.5, baseline_weight=0.05,
+                 cooldown=2.0, name='requests'):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.latency_margin = latency_margin
+        self.baseline_weight = baseline_weight
+        self.cooldown = cooldown
+        self.name = name
+
+        self.lock = threading.Lock()
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.latency_baselines = {}
+
+        self.requests = 0
+        self.slowdowns = 0
+        self.waited = 0.0
+
+    def reserve(self):
+        """Take a token and return how many seconds the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.paused_until - now, 0.0)
+            self.requests += 1
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait in the event loop until a request may be sent"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, latency, ok=True, status=None, retry_after=None, kind='page'):
+        """Adjust the rate after a request for a page of the given kind finished"""
+        with self.lock:
+            now = time.monotonic()
+            baseline = self.latency_baselines.get(kind)
+            slow = (baseline is not None
+                    and latency > max(self.latency_factor * baseline, baseline + self.latency_margin))
+
+            if ok and status != 429:
+                # Every answered request moves the baseline, so a lasting rise becomes the new normal
+                self.latency_baselines[kind] = (latency if baseline is None
+                                                else baseline + self.baseline_weight * (latency - baseline))
+                if not slow:
+                    # Additive increase: +increase requests/second per second of successful traffic
+                    self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+                    return
+
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+            # Multiplicative decrease, once per cooldown so a burst of failures counts as one signal
+            if now - self.last_decrease >= self.cooldown:
+                old_rate = self.rate
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.last_decrease = now
+                self.slowdowns += 1
+                reason = 'rate limited (429)' if status == 429 else 'slow response' if ok else 'error'
+                logger.warning(f"{self.name}: {reason} after {latency:.2f} seconds, "
+                               f"lowering rate from {old_rate:.2f} to {self.rate:.2f} requests/second")
+
+    def summary(self):
+        """One-line description of the limiter's state, for the end-of-run log"""
+        baselines = ", ".join(f"{kind} {baseline:.2f} s" for kind, baseline in sorted(self.latency_baselines.items()))
+        return (f"{self.name}: {self.requests} requests, current rate {self.rate:.2f} requests/second, "
+                f"{self.slowdowns} slowdowns, {self.waited:.1f} seconds spent waiting"
+                f"{f', latency baseline {baselines}' if baselines else ''}")
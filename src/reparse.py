@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+import os
+import time
+import logging
+import argparse
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from advice_parser import AdvicePageParser, advice_hash
+from page_archive import PageArchive
+from row_writer import COLUMNS
+from scraper import output_filename, parse_years, update_year_file
+
+logger = logging.getLogger(__name__)
+
+# Set in each worker process by init_worker
+_archive = None
+_parser = None
+
+
+def init_worker(archive_dir):
+    global _archive, _parser
+    _archive = PageArchive(archive_dir)
+    _parser = AdvicePageParser()
+    # Missing optional elements are logged per page; a corpus-wide run only needs the totals
+    logging.getLogger('advice_parser').setLevel(logging.ERROR)
+
+
+def parse_chunk(year, entries):
+    """Worker: read a chunk of archived detail pages and extract their fields.
+
+    Only the index entries travel to the worker; it reads the HTML from the
+    segment files itself.
+    """
+    rows = []
+    for entry in entries:
+        record = _archive.read(year, entry)
+        advice = _parser.parse_advice_page(record['html'])
+        rows.append({'url': entry['url'], **advice, 'content_hash': advice_hash(advice)})
+    return rows
+
+
+def overview_order(archive, year):
+    """Advice URLs in the order of the archived overview pages of a year"""
+    parser = AdvicePageParser()
+    pages = []
+    for entry in archive.entries(year, kind='overview'):
+        query = parse_qs(urlsplit(entry['url']).query)
+        pages.append((int(query.get('pager_page', ['0'])[0]), entry))
+
+    order = {}
+    for _, entry in sorted(pages, key=lambda page: page[0]):
+        parts = urlsplit(entry['url'])
+        html = archive.read(year, entry)['html']
+        for result in parser.parse_overview_page(html, f"{parts.scheme}://{parts.netloc}"):
+            order.setdefault(result['url'], len(order))
+    return order
+
+
+def reparse_year(executor, archive, year, output_file, chunk_size=100, overwrite=False):
+    """Rebuild a year's CSV from its archived detail pages; returns the number of rows.
+
+    An existing year file is updated in place by URL, keeping its other columns
+    and the advices that are not in the archive, unless overwrite is set.
+    """
+    start_time = time.time()
+    details = archive.entries(year, kind='detail')
+    # Keep the order of the scraped file: overview order, then anything not on an archived overview page
+    order = overview_order(archive, year)
+    details.sort(key=lambda entry: order.get(entry['url'], len(order)))
+
+    chunks = [details[i:i + chunk_size] for i in range(0, len(details), chunk_size)]
+    rows = []
+    for chunk_rows in executor.map(parse_chunk, [year] * len(chunks), chunks):
+        rows.extend(chunk_rows)
+
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    if os.path.exists(output_file) and not overwrite:
+        update_year_file(pd.read_csv(output_file, dtype=str), df, output_file)
+    else:
+        df.to_csv(output_file, index=False, encoding='utf-8')
+    missing = df['content'].isna().sum()
+    logger.info(f"Rebuilt {output_file} from {len(rows)} archived pages in {time.time() - start_time:.2f} seconds"
+                f"{f', {missing} without advice text' if missing else ''}")
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the yearly advice CSV files from archived pages, offline')
+    parser.add_argument('--archive-dir', default='page_archive', help='Archive written by scraper.py --archive-dir')
+    parser.add_argument('--years', type=str, help='Years to rebuild, e.g. 1990-2026 (default: every archived year)')
+    parser.add_argument('--processes', type=int, default=None, help='Parser processes (default: one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=100, help='Pages handed to a process at a time')
+    parser.add_argument('--test', action='store_true', help='Write the _test.csv file names')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='Replace existing year files instead of updating their rows by URL')
+    args = parser.parse_args()
+
+    start_time = time.time()
+    archive = PageArchive(args.archive_dir)
+    years = parse_years(args.years) if args.years else archive.years()
+    total = 0
+    with ProcessPoolExecutor(max_workers=args.processes, initializer=init_worker,
+                             initargs=(args.archive_dir,)) as executor:
+        for year in years:
+            if not archive.entries(year, kind='detail'):
+                logger.warning(f"No archived detail pages for {year}")
+                continue
+            total += reparse_year(executor, archive, year, output_filename(year, args.test), args.chunk_size,
+                                  args.overwrite)
+    logger.info(f"Reparsed {total} advices for {len(years)} years in {time.time() - start_time:.2f} seconds")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import os
+import csv
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ['url', 'content', 'reference', 'advice_type',
+           'datum_aanhangig', 'datum_vaststelling', 'datum_advies', 'datum_publicatie', 'content_hash']
+
+
+class CheckpointedCsvWriter:
+    """Stream scraped advices to a CSV file as they come in, with a resumable checkpoint.
+
+    Rows are flushed every flush_every rows or flush_interval seconds. After
+    each flush a checkpoint next to the output file records the file size
+    and the overview page and entry to continue from. If a run dies, the
+    next run truncates the file to the last checkpointed size (dropping any
+    half-written row) and resumes from that position.
+
+    With known_hashes (url -> content hash of an earlier scrape), only new or
+    changed advices are written, with a 'change' column saying which. Advices
+    that could not be fetched (no content, so no hash) are not written either;
+    they are counted in rows_failed, so the earlier version is kept.
+    """
+
+    def __init__(self, output_file, flush_every=10, flush_interval=30.0, known_hashes=None):
+        self.output_file = output_file
+        self.checkpoint_file = f"{output_file}.checkpoint.json"
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.checkpoint = self.read_checkpoint()
+        self.file = None
+        self.writer = None
+        self.known_hashes = known_hashes
+        self.columns = COLUMNS + ['change'] if known_hashes is not None else COLUMNS
+        self.rows_written = 0
+        self.rows_unchanged = 0
+        self.rows_failed = 0
+        self.unflushed = 0
+        self.last_flush = time.time()
+        self.position = None
+        # Overview page size the positions refer to, set by the scraper
+        self.page_size = None
+
+    def read_checkpoint(self):
+        """Return the checkpoint of an interrupted run, or None"""
+        if not os.path.exists(self.checkpoint_file) or not os.path.exists(self.output_file):
+            return None
+        try:
+            with open(self.checkpoint_file) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_file}: {e}")
+            return None
+        logger.info(f"Found checkpoint for {self.output_file}: page {checkpoint['page'] + 1}, "
+                    f"entry {checkpoint['entry'] + 1}, {checkpoint['rows']} rows")
+        return checkpoint
+
+    def open(self, append=False):
+        """Open the output file, resuming from a checkpoint or appending to existing rows if asked"""
+        exists = os.path.exists(self.output_file)
+        if self.checkpoint is not None:
+            # Drop anything written after the last checkpoint, e.g. a half-written row
+            with open(self.output_file, 'r+b') as f:
+                f.truncate(self.checkpoint['offset'])
+            self.rows_written = self.checkpoint['rows']
+            self.rows_failed = self.checkpoint.get('failed', 0)
+            append = True
+
+        if append and exists:
+            with open(self.output_file, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), None)
+            self.columns = header or self.columns
+            self.file = open(self.output_file, 'a', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction='ignore')
+            if not header:
+                self.writer.writeheader()
+        else:
+            self.file = open(self.output_file, 'w', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction='ignore')
+            self.writer.writeheader()
+        self.save_checkpoint()
+        logger.info(f"Streaming advices to {self.output_file}")
+
+    def write(self, row, page, entry):
+        """Write one advice; page and entry are its position on the overview pages"""
+        self.position = (page, entry + 1)
+        previous = self.known_hashes.get(row['url']) if self.known_hashes is not None else None
+        if self.known_hashes is not None and not row.get('content_hash'):
+            # Not fetched: a blank row must not replace the scraped version
+            self.rows_failed += 1
+        elif previous is not None and previous == row['content_hash']:
+            # Unchanged: nothing to write, but the checkpoint still moves past it
+            self.rows_unchanged += 1
+        else:
+            if self.known_hashes is not None:
+                row = {**row, 'change': 'new' if previous is None else 'changed'}
+            self.writer.writerow(row)
+            self.rows_written += 1
+            self.unflushed += 1
+        if self.unflushed >= self.flush_every or time.time() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Flush written rows to disk and record a checkpoint after them"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.save_checkpoint()
+        if self.unflushed:
+            logger.debug(f"Flushed {self.unflushed} rows to {self.output_file}")
+        self.unflushed = 0
+        self.last_flush = time.time()
+
+    def save_checkpoint(self):
+        page, entry = self.position or (
+            (self.checkpoint['page'], self.checkpoint['entry']) if self.checkpoint else (0, 0))
+        checkpoint = {
+            'page': page,
+            'entry': entry,
+            'rows': self.rows_written,
+            'failed': self.rows_failed,
+            'offset': self.file.tell(),
+            'page_size': self.page_size or (self.checkpoint or {}).get('page_size')
+        }
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def close(self, complete=True):
+        """Flush and close the file; the checkpoint is kept only if the scrape did not complete"""
+        if self.file is None:
+            return
+        self.flush()
+        self.file.close()
+        self.file = None
+        if complete:
+            os.remove(self.checkpoint_file)
+            logger.info(f"Wrote {self.rows_written} rows to {self.output_file}")
+        else:
+            logger.warning(f"Scrape did not complete; run again to resume from {self.checkpoint_file}")
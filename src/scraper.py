@@ -1,15 +1,26 @@
 import time
 import pandas as pd
-from bs4 import BeautifulSoup
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 import argparse
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+import datetime
+from advice_parser import AdvicePageParser, empty_advice, advice_hash
+from http_fetcher import HttpFetcher, USER_AGENT
+from driver_pool import DriverPool
+from overview_pipeline import OverviewProducer
+from page_cache import PageCache
+from rate_limiter import AdaptiveRateLimiter
+from row_writer import CheckpointedCsvWriter, COLUMNS
+from page_readiness import PageReadiness
+from page_archive import PageArchive
+from scraper_metrics import ScraperMetrics
 
 # Enhanced logging configuration with milliseconds
 logging.basicConfig(
@@ -19,15 +30,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Overview page sizes (pager_rows) to try, largest first, when probing what the site serves
+PAGE_SIZE_CANDIDATES = (1000, 500, 200)
+
+# Sub-resources we never need for the DOM text: images, fonts, stylesheets, media and trackers
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css', '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*siteimproveanalytics*', '*siteimprove.com*', '*hotjar.com*', '*piwik*', '*matomo*',
+]
+
 class RaadVanStateScraper:
-    def __init__(self, batch_size=200, test_mode=False, year=None):
+    def __init__(self, batch_size=200, test_mode=False, year=None, backend='selenium',
+                 concurrency=8, base_url=None, workers=1, extraction='dom',
+                 prefetch=0, cache_dir=None, cache_ttl=24 * 3600, cache_max_bytes=2 * 1024 ** 3,
+                 max_rate=8.0, block_resources=False, detail_javascript=True, recycle_after=0,
+                 ready_strategy='load', overview_wait=2.0, detail_wait=2.0, archive_dir=None,
+                 metrics_file=None, metrics_interval=60.0, auto_page_size=False):
         start_time = time.time()
         logger.info("Initializing scraper...")
 
-        self.base_url = "https://www.raadvanstate.nl"
+        self.base_url = base_url or "https://www.raadvanstate.nl"
         self.batch_size = batch_size
+        # Page size to use when not tuned; with auto_page_size each year probes the largest one the site serves
+        self.configured_batch_size = batch_size
+        self.auto_page_size = auto_page_size
+        # Overview pages fetched while probing the page size, handed out before fetching more
+        self.probed_pages = {}
         self.test_mode = test_mode
         self.year = year or "2025"
+        self.backend = backend
+        self.extraction = extraction
+        self.prefetch = prefetch
+        self.block_resources = block_resources
+        self.detail_javascript = detail_javascript
+        # Whether JavaScript is currently enabled, per driver (only tracked when it is switched off for details)
+        self.javascript_enabled = {}
+        self.page_load_times = {'overview': [], 'detail': []}
+        # Phase timings and counters, exported to metrics_file during and after a run
+        self.metrics = ScraperMetrics(metrics_file, interval=metrics_interval)
+        self.readiness = PageReadiness(ready_strategy, budgets={'overview': overview_wait, 'detail': detail_wait},
+                                       metrics=self.metrics)
+        # Restart a Chrome driver after this many page loads to limit memory growth (0 = never)
+        self.recycle_after = recycle_after
+        self.driver_pages = {}
+        self.parser = AdvicePageParser()
+        self.http = None
+        self.driver = None
+        self.cache = None
+        self.archive = PageArchive(archive_dir) if archive_dir else None
+        self.known_urls = set()
+        # Whether a page of known advices ends the scrape (incremental runs) or is just skipped
+        self.stop_at_known = False
+        # Position to resume from after an interrupted run, set by main()
+        self.start_page = 0
+        self.start_entry = 0
+        self.completed = False
+        self.pool = None
+        # Guards the lazily started main driver when the http backend falls back to it from several threads
+        self.driver_lock = threading.Lock()
+
+        self.cache_ttl = cache_ttl
+        if cache_dir:
+            self.cache = PageCache(cache_dir, ttl=cache_ttl, max_bytes=cache_max_bytes)
+            if backend == 'selenium' and extraction == 'dom':
+                logger.info("Only overview pages are cached: the dom extraction reads detail pages from the browser "
+                            "(use --extraction page_source or --backend http to cache them too)")
+        self.set_year(self.year)
+
+        # Shared by every driver and HTTP request, starting at the old one request per second (or below max_rate)
+        self.rate_limiter = AdaptiveRateLimiter(rate=min(1.0, max_rate), min_rate=min(0.1, max_rate),
+                                                max_rate=max_rate, name='raadvanstate.nl')
+
+        if backend == 'http':
+            # Chrome is only started lazily, for pages that turn out to need JavaScript
+            self.http = HttpFetcher(concurrency=concurrency, cache=self.cache, rate_limiter=self.rate_limiter,
+                                    metrics=self.metrics)
+        elif backend == 'selenium':
+            # The main driver handles overview pages; a pool handles detail pages if requested
+            self.driver = self.create_driver()
+            if workers > 1:
+                self.pool = DriverPool(self, workers)
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+
+        init_time = time.time() - start_time
+        logger.info(f"Scraper initialization ({backend} backend) completed in {init_time:.2f} seconds")
+
+        if test_mode:
+            logger.info("Running in test mode - will only process 10 advices")
+
+    def create_driver(self):
+        """Start a headless Chrome driver"""
+        start_time = time.time()
 
         # Setup Chrome options
         chrome_options = Options()
@@ -40,28 +137,169 @@ class RaadVanStateScraper:
         chrome_options.add_argument('--headless')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.page_load_strategy = self.readiness.page_load_strategy
+        if self.block_resources:
+            # Blocks images by content type, including those without a recognisable file extension
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
 
         logger.debug("Chrome options configured, initializing driver...")
 
         # Initialize the driver
-        self.driver = webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
 
         # Update the navigator.webdriver flag to undefined
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
         # Set a proper user agent
-        self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+            "userAgent": USER_AGENT
         })
 
-        # Reduce implicit wait time from 10 to 5 seconds
-        self.driver.implicitly_wait(5)
-
-        init_time = time.time() - start_time
-        logger.info(f"Scraper initialization completed in {init_time:.2f} seconds")
-
-        if test_mode:
-            logger.info("Running in test mode - will only process 10 advices")
+        if self.block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            logger.debug(f"Blocking {len(BLOCKED_URL_PATTERNS)} sub-resource URL patterns")
+
+        # No implicit waits: required elements get explicit budgets, optional ones are looked up without waiting
+        driver.implicitly_wait(0)
+
+        logger.info(f"Chrome driver started in {time.time() - start_time:.2f} seconds")
+        return driver
+
+    def set_year(self, year):
+        """Switch the scraper to another year and reset the per-run state"""
+        self.year = str(year)
+        self.batch_size = self.configured_batch_size
+        self.probed_pages = {}
+        self.start_page = 0
+        self.start_entry = 0
+        self.known_urls = set()
+        self.stop_at_known = False
+        if self.cache is not None:
+            # Advices of past years no longer change, so their pages never expire. Overview
+            # pages still do: advices of a past year can be published late.
+            past_year = int(self.year) < datetime.date.today().year
+            self.cache.ttl = self.cache_ttl
+            self.cache.ttls = {'detail': None} if past_year else {}
+
+    def recycle_driver(self, driver):
+        """Quit a driver and return a fresh one"""
+        pages = self.driver_pages.pop(id(driver), 0)
+        self.javascript_enabled.pop(id(driver), None)
+        logger.info(f"Recycling Chrome driver after {pages} page loads")
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting driver: {e}")
+        return self.create_driver()
+
+    def needs_recycling(self, driver):
+        """Whether a driver has loaded enough pages to be restarted"""
+        return bool(self.recycle_after) and self.driver_pages.get(id(driver), 0) >= self.recycle_after
+
+    def maybe_recycle_main_driver(self):
+        """Restart the main driver if it is due, unless the overview producer is using it"""
+        if self.driver is None or not self.needs_recycling(self.driver):
+            return
+        if self.prefetch > 0 and self.pool is not None:
+            return
+        with self.driver_lock:
+            self.driver = self.recycle_driver(self.driver)
+
+    def ensure_driver(self):
+        """Make sure a Chrome driver is available, starting one on first use"""
+        if self.driver is None:
+            logger.info("Starting Chrome driver for pages that need JavaScript")
+            self.driver = self.create_driver()
+        return self.driver
+
+    def close(self):
+        """Shut down the Chrome drivers, if any were started"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def load_known_urls(self, csv_file):
+        """Load the URLs of advices already scraped into an existing year file.
+
+        Advices without text (their page could not be fetched) do not count as
+        known, so they are fetched again when the scrape comes across them.
+        Raises ValueError if the file cannot be read, since appending to it
+        without knowing its advices would scrape the whole year into it again.
+        """
+        try:
+            existing = pd.read_csv(csv_file, usecols=['url', 'content'], dtype=str)
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"Could not load known advices from {csv_file}: {e}")
+            raise ValueError(f"Cannot append to {csv_file}, its advices could not be read: {e}") from e
+        scraped = existing['content'].fillna('').str.strip() != ''
+        self.known_urls = set(existing.loc[scraped, 'url'].dropna())
+        logger.info(f"Loaded {len(self.known_urls)} known advice URLs from {csv_file}")
+        if not scraped.all():
+            logger.info(f"{(~scraped).sum()} advices in {csv_file} have no text and will be fetched again")
+
+    def cached_page(self, url, marker, kind):
+        """Return fresh cached HTML for a URL if it contains the expected marker, else None"""
+        if self.cache is None:
+            return None
+        entry = self.cache.get(url, kind)
+        if entry is None or not entry['fresh'] or marker not in entry['html']:
+            return None
+        logger.info(f"Using cached page for {url}")
+        self.metrics.increment('cache_hits')
+        return entry['html']
+
+    def store_page(self, url, html, marker):
+        """Cache a page rendered by Selenium, unless it looks incomplete"""
+        if self.cache is not None and html and marker in html:
+            self.cache.put(url, html)
+
+    def archive_page(self, url, html, kind):
+        """Keep the raw HTML of a fetched page in the archive, if one is configured"""
+        if self.archive is not None and html:
+            try:
+                self.archive.put(self.year, url, html, kind)
+            except OSError as e:
+                logger.warning(f"Could not archive {url}: {e}")
+
+    def set_javascript(self, driver, enabled):
+        """Switch JavaScript execution on or off for a driver, if it is not already in that state"""
+        if self.javascript_enabled.get(id(driver), True) != enabled:
+            driver.execute_cdp_cmd('Emulation.setScriptExecutionDisabled', {'value': not enabled})
+            self.javascript_enabled[id(driver)] = enabled
+
+    def load_page(self, driver, url, kind='detail'):
+        """Navigate a driver to a URL, paced by the shared rate limiter. Returns the load time."""
+        if not self.detail_javascript:
+            self.set_javascript(driver, kind != 'detail')
+        self.rate_limiter.acquire()
+        page_load_start = time.time()
+        try:
+            driver.get(url)
+        except Exception:
+            self.rate_limiter.record(time.time() - page_load_start, ok=False, kind=kind)
+            self.metrics.increment('errors', f'{kind}_load')
+            raise
+        page_load_time = time.time() - page_load_start
+        self.rate_limiter.record(page_load_time, kind=kind)
+        self.page_load_times[kind].append(page_load_time)
+        self.metrics.observe(f'{kind}_load', page_load_time)
+        self.driver_pages[id(driver)] = self.driver_pages.get(id(driver), 0) + 1
+        return page_load_time
+
+    def page_load_summary(self):
+        """Average Selenium page load times, labelled with the resource blocking settings"""
+        settings = (f"resource blocking {'on' if self.block_resources else 'off'}, "
+                    f"detail JavaScript {'on' if self.detail_javascript else 'off'}")
+        parts = []
+        for kind, times in self.page_load_times.items():
+            if times:
+                parts.append(f"{kind} {sum(times) / len(times):.2f}s avg over {len(times)} pages")
+        return f"Page loads ({settings}): {', '.join(parts) or 'none'}"
 
     def get_overview_url(self, page=0):
         """Generate URL for overview page with filters"""
@@ -74,95 +312,143 @@ class RaadVanStateScraper:
         logger.info(f"Generated URL for year {self.year}, page {page}: {url}")
         return url
 
-    def get_page_content(self, url):
+    def tune_page_size(self):
+        """Find the number of advices per overview page the site actually serves and paginate on it.
+
+        Asks for the largest candidate page size first. A full page means the
+        site honours it. A shorter one means either the whole year fits on one
+        page or the site caps the page size; page 1 at the returned size tells
+        the two apart. The probed pages are kept, so no request is wasted.
+        """
+        start_time = time.time()
+        for requested in PAGE_SIZE_CANDIDATES:
+            self.batch_size = requested
+            first = self.parse_overview_page(self.get_page_content(self.get_overview_url(0)))
+            if first:
+                break
+            logger.info(f"No entries with pager_rows={requested}, trying a smaller page size")
+        else:
+            self.probed_pages = {0: first}
+            return self.batch_size
+
+        self.probed_pages = {0: first}
+        if len(first) < requested:
+            self.batch_size = len(first)
+            try:
+                second = self.parse_overview_page(self.get_page_content(self.get_overview_url(1)))
+            except Exception as e:
+                # Paginating on the returned size is right either way; page 1 is fetched again later
+                logger.warning(f"Could not probe overview page 2: {e}")
+                second = None
+            if second is not None:
+                # Some servers answer a page past the end with the last page again
+                if second and second[0]['url'] == first[0]['url']:
+                    second = []
+                self.probed_pages[1] = second
+                if second:
+                    logger.info(f"Site caps pager_rows={requested} at {len(first)} entries")
+        logger.info(f"Using {self.batch_size} advices per overview page for {self.year} "
+                    f"(probed in {time.time() - start_time:.2f} seconds)")
+        return self.batch_size
+
+    def overview_results(self, page, driver=None):
+        """Parsed entries of an overview page, using the page fetched while probing if there is one"""
+        if page in self.probed_pages:
+            return self.probed_pages.pop(page)
+        return self.parse_overview_page(self.get_page_content(self.get_overview_url(page), driver=driver))
+
+    def get_page_content(self, url, driver=None):
+        """Fetch overview page content, over HTTP or with Selenium depending on the backend"""
+        html = self.fetch_overview_page(url, driver)
+        self.metrics.increment('pages', 'overview')
+        self.archive_page(url, html, 'overview')
+        return html
+
+    def fetch_overview_page(self, url, driver=None):
+        """Fetch an overview page from the cache, over HTTP or with Selenium"""
+        if self.backend == 'http':
+            html = self.http.fetch(url, kind='overview')
+            if html is not None:
+                # A page without entries is past the end of the year, not one that needs JavaScript
+                return html
+            logger.warning(f"Could not fetch overview page {url} over plain HTTP, falling back to Selenium")
+            if driver is None:
+                with self.driver_lock:
+                    html = self.get_page_content_selenium(url)
+                self.store_page(url, html, 'ipx-pt-advies')
+                return html
+        else:
+            html = self.cached_page(url, 'ipx-pt-advies', 'overview')
+            if html is not None:
+                return html
+
+        html = self.get_page_content_selenium(url, driver)
+        self.store_page(url, html, 'ipx-pt-advies')
+        return html
+
+    def get_page_content_selenium(self, url, driver=None):
         """Fetch page content using Selenium with enhanced timing information"""
         start_time = time.time()
         logger.info(f"Navigating to {url}")
+        driver = driver or self.ensure_driver()
 
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                page_load_start = time.time()
-                self.driver.get(url)
-                page_load_time = time.time() - page_load_start
+                page_load_time = self.load_page(driver, url, kind='overview')
                 logger.debug(f"Initial page load took {page_load_time:.2f} seconds")
 
-                # Wait for content with timeout
-                try:
-                    wait_start = time.time()
-                    WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "ipx-pt-advies"))
-                    )
-                    wait_time = time.time() - wait_start
-                    logger.debug(f"Content wait completed in {wait_time:.2f} seconds")
-                except TimeoutException:
-                    logger.warning("Content wait timed out after 2 seconds")
+                # Wait for content within the overview budget
+                ready, _ = self.readiness.wait(driver, 'overview', (By.CLASS_NAME, "ipx-pt-advies"))
+                if not ready and not driver.find_elements(By.CLASS_NAME, "ipx-pt-advies"):
+                    # An unready page parses to no entries, which would end the year early
+                    loaded = driver.execute_script("return document.readyState") == 'complete'
+                    if attempt < max_retries - 1 or not loaded:
+                        raise RuntimeError(f"Overview page not ready (document {'loaded' if loaded else 'still loading'})")
+                    logger.info(f"Overview page {url} loaded {max_retries} times without entries, "
+                                f"taking it as past the last page")
 
                 total_time = time.time() - start_time
                 logger.info(f"Page content fetch completed in {total_time:.2f} seconds")
-                return self.driver.page_source
+                return driver.page_source
 
             except Exception as e:
                 retry_time = time.time() - start_time
                 logger.error(f"Attempt {attempt + 1} failed after {retry_time:.2f} seconds: {str(e)}")
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(2 ** attempt)
+                self.metrics.increment('retries', 'overview')
 
     def parse_overview_page(self, html):
         """Parse the overview page and extract advice URLs"""
         start_time = time.time()
         logger.debug("Starting to parse overview page")
 
-        # Log a snippet of the HTML to see what we're getting
-        logger.debug(f"First 500 characters of HTML: {html[:500]}")
-
         # Check if we got any content at all
         if not html or len(html.strip()) == 0:
             logger.error("Received empty HTML content")
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
-        entries = soup.find_all('div', class_='ipx-pt-advies')
+        # Log a snippet of the HTML to see what we're getting (only formatted when debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"First 500 characters of HTML: {html[:500]}")
 
-        logger.debug(f"Found {len(entries)} entries to process")
-        results = []
-        for i, entry in enumerate(entries, 1):
-            entry_start = time.time()
-            try:
-                title_elem = entry.find('h2')
-                if not title_elem:
-                    logger.warning(f"No title element found in entry {i}")
-                    continue
-
-                link = title_elem.find('a')
-                if not link:
-                    logger.warning(f"No link found in title element for entry {i}")
-                    continue
-
-                url = link.get('href')
-                if url:
-                    url = url if url.startswith('http') else f"{self.base_url}{url}"
-                else:
-                    logger.warning(f"No URL found in link for entry {i}")
-                    continue
-
-                results.append({
-                    'url': url,
-                })
-                entry_time = time.time() - entry_start
-                logger.debug(f"Processed entry {i} in {entry_time:.2f} seconds")
-
-            except Exception as e:
-                logger.error(f"Error parsing entry {i}: {e}")
-                continue
+        try:
+            results = self.parser.parse_overview_page(html, self.base_url)
+        except Exception as e:
+            logger.error(f"Error parsing overview page: {e}")
+            return []
 
         total_time = time.time() - start_time
+        self.metrics.observe('overview_parse', total_time)
+        if not results:
+            self.metrics.increment('empty_pages', 'overview')
         logger.info(f"Found {len(results)} results on page in {total_time:.2f} seconds")
         return results
 
-    def get_advice_dates(self):
+    def get_advice_dates(self, driver=None):
         """Extract date metadata from the current page with optimized performance"""
+        driver = driver or self.driver
         start_time = time.time()
         logger.debug("Starting to extract dates")
 
@@ -182,13 +468,9 @@ class RaadVanStateScraper:
         }
 
         try:
-            # Use a shorter implicit wait temporarily for faster negative results
-            original_wait = self.driver.timeouts.implicit_wait
-            self.driver.implicitly_wait(1)
-
             # Find all date elements in one go using a CSS selector
             selector = ', '.join(f'.{class_name}' for class_name in metadata_map.keys())
-            date_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            date_elements = driver.find_elements(By.CSS_SELECTOR, selector)
 
             # Process found date elements
             found_dates = []
@@ -211,9 +493,6 @@ class RaadVanStateScraper:
                     except Exception as e:
                         logger.warning(f"Error extracting text from date element: {e}")
 
-            # Reset the implicit wait to original value
-            self.driver.implicitly_wait(original_wait)
-
             total_time = time.time() - start_time
             if found_dates:
                 logger.info(f"Found dates: {', '.join(found_dates)} in {total_time:.2f} seconds")
@@ -222,53 +501,80 @@ class RaadVanStateScraper:
 
         except Exception as e:
             logger.error(f"Error during date extraction: {e}")
-            # Reset the implicit wait to original value in case of error
-            self.driver.implicitly_wait(original_wait)
 
         return dates
 
-    def get_advice_content(self, url):
+    def get_advice_content(self, url, driver=None):
         """Get the full text content and metadata of an individual advice"""
         start_time = time.time()
         logger.info(f"Starting to fetch advice content from {url}")
 
-        try:
-            page_load_start = time.time()
-            self.driver.get(url)
-            logger.debug(f"Page load took {time.time() - page_load_start:.2f} seconds")
+        # The dom extraction reads the rendered elements, so cached HTML would give it parser output instead
+        use_cache = self.extraction == 'page_source'
+        html = self.cached_page(url, 'volledigetekst', 'detail') if use_cache else None
+        if html is not None:
+            self.archive_page(url, html, 'detail')
+            return self.parse_advice_page(html)
 
-            # Wait for content
-            try:
-                wait_start = time.time()
-                WebDriverWait(self.driver, 2).until(
-                    EC.presence_of_element_located((By.ID, "volledigetekst"))
-                )
-                logger.debug(f"Content wait took {time.time() - wait_start:.2f} seconds")
-            except TimeoutException:
-                logger.warning("Content wait timed out after 2 seconds")
+        try:
+            driver = driver or self.ensure_driver()
+            page_load_time = self.load_page(driver, url)
+            logger.debug(f"Page load took {page_load_time:.2f} seconds")
+
+            # Wait for content within the detail budget, reloading once if it doesn't appear
+            ready, _ = self.readiness.wait(driver, 'detail', (By.ID, "volledigetekst"))
+            if not ready and not driver.find_elements(By.ID, "volledigetekst"):
+                self.metrics.increment('retries', 'detail')
+                self.load_page(driver, url)
+                ready, _ = self.readiness.wait(driver, 'detail', (By.ID, "volledigetekst"))
+                if not ready and not driver.find_elements(By.ID, "volledigetekst"):
+                    raise RuntimeError("Detail page has no volledigetekst after a reload")
+
+            page_source = None
+            if use_cache or self.archive is not None:
+                page_source = driver.page_source
+                if use_cache:
+                    self.store_page(url, page_source, 'volledigetekst')
+                self.archive_page(url, page_source, 'detail')
+
+            if self.extraction == 'page_source':
+                # One WebDriver round trip, then parse everything in Python
+                extract_start = time.time()
+                advice = self.parse_advice_page(page_source)
+                logger.debug(f"Page source extraction took {time.time() - extract_start:.2f} seconds")
+                total_time = time.time() - start_time
+                logger.info(f"Completed fetching advice content in {total_time:.2f} seconds")
+                return advice
 
             # Get the content
             content_start = time.time()
-            content_div = self.driver.find_element(By.ID, "volledigetekst")
+            content_div = driver.find_element(By.ID, "volledigetekst")
             content = content_div.text if content_div else None
+            self.metrics.observe('content_extraction', time.time() - content_start)
             logger.debug(f"Content extraction took {time.time() - content_start:.2f} seconds")
 
-            # Get the reference number
+            # Get the reference number (optional, so looked up without waiting)
             ref_start = time.time()
+            kenmerk = None
             try:
-                kenmerk_div = self.driver.find_element(By.CLASS_NAME, "meta-value-kenmerk")
-                kenmerk = kenmerk_div.text.strip() if kenmerk_div else None
+                kenmerk_divs = driver.find_elements(By.CLASS_NAME, "meta-value-kenmerk")
+                if kenmerk_divs:
+                    kenmerk = kenmerk_divs[0].text.strip()
+                else:
+                    logger.warning("Could not find kenmerk")
+                self.metrics.observe('reference_extraction', time.time() - ref_start)
                 logger.debug(f"Reference extraction took {time.time() - ref_start:.2f} seconds")
             except Exception as e:
-                logger.warning(f"Could not find kenmerk: {e}")
-                kenmerk = None
+                logger.warning(f"Could not read kenmerk: {e}")
 
-            # Get advice type
+            # Get advice type (optional, so looked up without waiting)
             type_start = time.time()
             advice_type = None
             try:
-                keywords_ul = self.driver.find_element(By.CLASS_NAME, "trefwoorden")
-                keywords_items = keywords_ul.find_elements(By.TAG_NAME, "li")
+                keywords_uls = driver.find_elements(By.CLASS_NAME, "trefwoorden")
+                if not keywords_uls:
+                    logger.warning("Could not find keywords")
+                keywords_items = keywords_uls[0].find_elements(By.TAG_NAME, "li") if keywords_uls else []
 
                 for item in keywords_items:
                     title = item.get_attribute('title')
@@ -278,13 +584,15 @@ class RaadVanStateScraper:
                     elif title == "Soort advies Algemene maatregel van bestuur":
                         advice_type = "AMVB"
                         break
+                self.metrics.observe('type_extraction', time.time() - type_start)
                 logger.debug(f"Advice type extraction took {time.time() - type_start:.2f} seconds")
             except Exception as e:
                 logger.warning(f"Could not find keywords: {e}")
 
             # Get dates
             dates_start = time.time()
-            dates = self.get_advice_dates()
+            dates = self.get_advice_dates(driver)
+            self.metrics.observe('dates_extraction', time.time() - dates_start)
             logger.debug(f"Dates extraction took {time.time() - dates_start:.2f} seconds")
 
             total_time = time.time() - start_time
@@ -300,105 +608,471 @@ class RaadVanStateScraper:
         except Exception as e:
             error_time = time.time() - start_time
             logger.error(f"Error fetching advice content after {error_time:.2f} seconds: {e}")
-            return {
-                'content': None,
-                'reference': None,
-                'advice_type': None,
-                'datum_aanhangig': None,
-                'datum_vaststelling': None,
-                'datum_advies': None,
-                'datum_publicatie': None
-            }
+            self.metrics.increment('errors', 'detail')
+            return empty_advice()
+
+    def parse_advice_page(self, html):
+        """Extract the advice fields from detail page HTML, timing it as the detail_parse phase"""
+        parse_start = time.time()
+        advice = self.parser.parse_advice_page(html)
+        self.metrics.observe('detail_parse', time.time() - parse_start)
+        return advice
+
+    def get_advice_contents_http(self, urls):
+        """Fetch advices concurrently over HTTP and yield them in order, falling back to Selenium for pages that need JavaScript.
+
+        Pages are fetched a few times the concurrency at a time, so each batch is
+        written and checkpointed before the next is fetched and a large overview
+        page is never held in memory as a whole.
+        """
+        batch_size = self.http.concurrency * 4
+        for start in range(0, len(urls), batch_size):
+            batch = urls[start:start + batch_size]
+            for url, html in zip(batch, self.http.fetch_all(batch)):
+                if html and 'volledigetekst' in html:
+                    self.archive_page(url, html, 'detail')
+                    yield self.parse_advice_page(html)
+                else:
+                    logger.warning(f"No advice text in plain HTTP response for {url}, falling back to Selenium")
+                    with self.driver_lock:
+                        yield self.get_advice_content(url)
+
+    def fetch_advices(self, page_results):
+        """Yield the content of every advice on an overview page, in overview order, as it comes in"""
+        urls = [result['url'] for result in page_results]
+        if self.backend == 'http':
+            advices = self.get_advice_contents_http(urls)
+        elif self.pool is not None:
+            advices = self.pool.fetch_all(urls)
+        else:
+            advices = (self.get_advice_content(url) for url in urls)
+        for advice in advices:
+            advice['content_hash'] = advice_hash(advice)
+            self.metrics.increment('pages', 'detail')
+            if not advice.get('content'):
+                self.metrics.increment('empty_pages', 'detail')
+            yield advice
+            self.metrics.maybe_export()
+
+    def iter_overview_pages(self):
+        """Yield (page, results) for each overview page, fetched one at a time"""
+        page = self.start_page
+        while True:
+            logger.info(f"Scraping page {page + 1}")
+            yield page, self.overview_results(page)
+            page += 1
 
-    def scrape(self):
-        """Main scraping function"""
+    def scrape(self, writer=None):
+        """Main scraping function.
+
+        With a writer, every advice is written as soon as it is fetched and not
+        kept in memory, and the returned DataFrame is empty.
+        """
         start_time = time.time()
         logger.info(f"Starting scraping process for year {self.year}")
+        self.completed = False
 
         # First verify the year is valid
-        if not (1900 <= int(self.year) <= 2025):
+        if not (1900 <= int(self.year) <= datetime.date.today().year):
             logger.error(f"Invalid year {self.year}. Please check the year is correct.")
             return pd.DataFrame()
 
         all_results = []
-        page = 0
+        page = self.start_page
         processed_advices = 0
+        pages = None
 
-        while True:
-            page_start = time.time()
-            url = self.get_overview_url(page)
-            logger.info(f"Scraping page {page + 1}")
-
-            try:
-                html = self.get_page_content(url)
-                page_results = self.parse_overview_page(html)
+        page_start = time.time()
+        try:
+            # Page numbers of a resumed run only line up with the page size it was started with
+            if self.auto_page_size and self.start_page == 0 and self.start_entry == 0:
+                self.tune_page_size()
+            if writer is not None:
+                writer.page_size = self.batch_size
+
+            if self.prefetch > 0:
+                logger.info(f"Prefetching up to {self.prefetch} overview pages ahead")
+                pages = OverviewProducer(self, max_pages_ahead=self.prefetch)
+            else:
+                pages = self.iter_overview_pages()
 
+            for page, page_results in pages:
                 if not page_results:
                     logger.info("No results found on page, stopping")
                     break
 
+                # Keep each advice's position on the page for checkpointing
+                positions = list(enumerate(page_results))
+                if page == self.start_page and self.start_entry:
+                    logger.info(f"Resuming page {page + 1} at entry {self.start_entry + 1}")
+                    positions = positions[self.start_entry:]
+
                 if self.test_mode:
-                    remaining = 10 - len(all_results)
+                    remaining = 10 - processed_advices
                     if remaining > 0:
-                        page_results = page_results[:remaining]
+                        positions = positions[:remaining]
                         logger.debug(f"Test mode: limited to {remaining} results")
                     else:
                         break
 
-                for i, result in enumerate(page_results, 1):
-                    advice_start = time.time()
-                    time.sleep(1)  # Reduced delay between requests
-                    advice_data = self.get_advice_content(result['url'])
+                # Incremental and resumed runs only fetch advices that are not in the file yet
+                new_positions = [(i, result) for i, result in positions if result['url'] not in self.known_urls]
+                if positions and not new_positions and self.stop_at_known:
+                    logger.info(f"All {len(positions)} advices on page {page + 1} are already known, stopping")
+                    break
+                if len(new_positions) < len(positions):
+                    logger.info(f"Skipping {len(positions) - len(new_positions)} already known advices")
+
+                advices_start = time.time()
+                new_results = [result for _, result in new_positions]
+                for (i, result), advice_data in zip(new_positions, self.fetch_advices(new_results)):
                     result.update(advice_data)
                     processed_advices += 1
-                    advice_time = time.time() - advice_start
-                    logger.info(f"Processed advice {processed_advices} ({result['reference']}) in {advice_time:.2f} seconds")
-
-                all_results.extend(page_results)
+                    logger.info(f"Processed advice {processed_advices} ({result['reference']})")
+                    if writer is not None:
+                        writer.write(result, page, i)
+                    else:
+                        all_results.append(result)
+                advices_time = time.time() - advices_start
+                logger.info(f"Fetched {len(new_results)} advices in {advices_time:.2f} seconds")
 
                 if len(page_results) < self.batch_size:
                     logger.info("Reached the last page with fewer entries than batch size")
                     break
 
-                if self.test_mode and len(all_results) >= 10:
+                if self.test_mode and processed_advices >= 10:
                     logger.info("Test mode: reached 10 advices, stopping")
                     break
 
-                page += 1
                 page_time = time.time() - page_start
-                logger.info(f"Completed page {page} in {page_time:.2f} seconds")
-                time.sleep(1)
+                logger.info(f"Completed page {page + 1} in {page_time:.2f} seconds")
+                self.maybe_recycle_main_driver()
+                page_start = time.time()
 
-            except Exception as e:
-                logger.error(f"Error processing page {page}: {e}")
-                break
+            self.completed = True
+
+        except Exception as e:
+            logger.error(f"Error processing page {page}: {e}")
+        finally:
+            if pages is not None:
+                pages.close()
 
         total_time = time.time() - start_time
-        logger.info(f"Total scraping completed in {total_time:.2f} seconds. Collected {len(all_results)} results.")
+        logger.info(f"Total scraping completed in {total_time:.2f} seconds. Collected {processed_advices} results.")
+        logger.info(f"Rate limiter {self.rate_limiter.summary()}")
+        logger.info(self.page_load_summary())
+        if self.driver is not None or self.pool is not None:
+            logger.info(self.readiness.summary())
+        self.metrics.export()
+        if self.archive is not None:
+            logger.info(f"Archived {self.archive.pages_written} new or changed pages "
+                        f"({self.archive.bytes_written / 1024 ** 2:.1f} MB compressed)")
         return pd.DataFrame(all_results)
 
+def parse_years(spec):
+    """Parse a year list such as '1990-2026' or '2019,2021-2023' into a sorted list of years"""
+    years = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            first, last = (int(year) for year in part.split('-', 1))
+            years.update(range(first, last + 1))
+        elif part:
+            years.add(int(part))
+    return [str(year) for year in sorted(years)]
+
+
+def build_scraper(args, year):
+    """Create a scraper from the command line options added by add_scraper_arguments"""
+    return RaadVanStateScraper(batch_size=args.page_size or 200, auto_page_size=args.page_size is None,
+                               test_mode=args.test, year=year,
+                               backend=args.backend, concurrency=args.concurrency,
+                               base_url=args.base_url, workers=args.workers,
+                               extraction=args.extraction, prefetch=args.prefetch,
+                               cache_dir=None if args.no_cache else args.cache_dir,
+                               cache_ttl=args.cache_ttl * 3600,
+                               cache_max_bytes=args.cache_max_mb * 1024 ** 2,
+                               max_rate=args.max_rate, block_resources=args.block_resources,
+                               detail_javascript=not args.no_detail_js,
+                               recycle_after=args.recycle_after, ready_strategy=args.ready_strategy,
+                               overview_wait=args.overview_wait, detail_wait=args.detail_wait,
+                               archive_dir=args.archive_dir, metrics_file=metrics_filename(args, year),
+                               metrics_interval=args.metrics_interval)
+
+
+def metrics_filename(args, year):
+    """Metrics export file for a scraper; with --years every year's process gets its own file"""
+    if not args.metrics_file or not getattr(args, 'years', None):
+        return args.metrics_file
+    root, extension = os.path.splitext(args.metrics_file)
+    return f"{root}_{year}{extension}"
+
+
+def output_filename(year, test_mode=False):
+    """CSV file a year is scraped into"""
+    return f'raad_van_state_adviezen_{year}_test.csv' if test_mode else f'raad_van_state_adviezen_{year}.csv'
+
+
+def run_year(scraper, year, output_file, incremental=False):
+    """Scrape one year with an existing scraper into output_file, resuming from a checkpoint if there is one.
+
+    Returns the number of rows in the file and whether the year was scraped completely.
+    """
+    scraper.set_year(year)
+    writer = CheckpointedCsvWriter(output_file)
+    if writer.checkpoint is not None:
+        scraper.start_page = writer.checkpoint['page']
+        scraper.batch_size = writer.checkpoint.get('page_size') or scraper.batch_size
+        scraper.start_entry = writer.checkpoint['entry']
+    append = incremental and os.path.exists(output_file)
+    if append and writer.checkpoint is None:
+        scraper.load_known_urls(output_file)
+    scraper.stop_at_known = incremental
+
+    scraper.completed = False
+    try:
+        writer.open(append=append)
+        if writer.checkpoint is not None:
+            # After truncating to the checkpoint: advices written before the interruption are not fetched again
+            scraper.load_known_urls(output_file)
+        scraper.scrape(writer=writer)
+    finally:
+        writer.close(complete=scraper.completed)
+    if (append or writer.checkpoint is not None) and scraper.completed:
+        replace_refetched_failures(output_file)
+    return writer.rows_written, scraper.completed
+
+
+def replace_refetched_failures(output_file):
+    """Put advices scraped again after a failed fetch in place of their rows without text in a year file.
+
+    The new versions were appended by an incremental run; they take the place
+    of the empty rows, keeping those rows' position and other columns.
+    """
+    df = pd.read_csv(output_file, dtype=str)
+    scraped = df['content'].fillna('').str.strip() != ''
+    refetched = scraped & df['url'].isin(df.loc[~scraped, 'url'])
+    if refetched.any():
+        # Keep one empty row per advice to overwrite, e.g. after a resumed run wrote it twice
+        existing = df[~refetched & ~(~scraped & df['url'].duplicated())]
+        update_year_file(existing, df[refetched].drop_duplicates('url', keep='last'), output_file)
+    missing = (~scraped & ~df['url'].isin(df.loc[scraped, 'url'])).sum()
+    if missing:
+        logger.warning(f"{missing} advices in {output_file} still have no text; run --revalidate to fetch them again")
+
+
+def changed_filename(output_file):
+    """CSV file the new and changed advices found by --revalidate are written to"""
+    return f"{os.path.splitext(output_file)[0]}_changed.csv"
+
+
+def revalidate_year(scraper, year, output_file):
+    """Re-fetch every advice of a scraped year and write only new or changed ones to the _changed file.
+
+    Changes are detected by comparing content hashes with output_file, which
+    is then updated with the new versions. Returns the number of new or
+    changed advices and whether the year was revalidated completely.
+    """
+    existing = pd.read_csv(output_file, dtype=str)
+    if 'content_hash' not in existing.columns:
+        # Files scraped before hashes were stored
+        existing['content_hash'] = [advice_hash(row) for row in existing.to_dict('records')]
+    known_hashes = dict(zip(existing['url'], existing['content_hash'].where(existing['content_hash'].notna(), '')))
+    logger.info(f"Revalidating {len(known_hashes)} advices of {output_file}")
+
+    scraper.set_year(year)
+    if scraper.cache is not None:
+        # Cached pages count as stale, so each one is revalidated with the site
+        scraper.cache.ttl = 0
+        scraper.cache.ttls = {}
+    changed_file = changed_filename(output_file)
+    writer = CheckpointedCsvWriter(changed_file, known_hashes=known_hashes)
+    if writer.checkpoint is not None:
+        scraper.start_page = writer.checkpoint['page']
+        scraper.start_entry = writer.checkpoint['entry']
+        scraper.batch_size = writer.checkpoint.get('page_size') or scraper.batch_size
+
+    scraper.completed = False
+    try:
+        writer.open(append=writer.checkpoint is not None)
+        scraper.scrape(writer=writer)
+    finally:
+        writer.close(complete=scraper.completed)
+    logger.info(f"{writer.rows_written} new or changed and {writer.rows_unchanged} unchanged advices"
+                f"{f', {writer.rows_failed} could not be fetched' if writer.rows_failed else ''}")
+
+    completed = scraper.completed and not writer.rows_failed
+    if completed:
+        # Bring the year file up to date, so the next revalidation compares against these versions
+        update_year_file(existing, pd.read_csv(changed_file, dtype=str), output_file)
+    elif scraper.completed:
+        logger.warning(f"Not updating {output_file}: {writer.rows_failed} advices could not be fetched; "
+                       f"run --revalidate again to retry the year")
+    return writer.rows_written, completed
+
+
+def update_year_file(existing, changed, output_file):
+    """Write the scraped columns of changed advices over their rows in a year file and append new ones.
+
+    Other columns, such as the datum_*_formatted ones added by validator.py
+    (some filled in by hand), and the order of the rows are kept.
+    """
+    # Never let an advice without text replace a scraped one
+    changed = changed[changed['content'].fillna('').str.strip() != '']
+    columns = [column for column in COLUMNS if column in changed.columns]
+    updated = existing.reindex(columns=list(existing.columns) + [c for c in columns if c not in existing.columns])
+    rows = {url: index for index, url in zip(updated.index, updated['url'])}
+    is_new = ~changed['url'].isin(rows)
+    updated.loc[changed.loc[~is_new, 'url'].map(rows).values, columns] = changed.loc[~is_new, columns].values
+    updated = pd.concat([updated, changed.loc[is_new, columns]], ignore_index=True)
+
+    tmp_file = f"{output_file}.tmp"
+    updated.to_csv(tmp_file, index=False, encoding='utf-8')
+    os.replace(tmp_file, output_file)
+    logger.info(f"Updated {(~is_new).sum()} and added {is_new.sum()} advices in {output_file}")
+
+
+def scrape_year(year, args):
+    """Scrape one year into its own CSV file and return a summary of the run"""
+    start_time = time.time()
+    logger.info(f"Starting scraper for year: {year}")
+
+    scraper = build_scraper(args, year)
+    # Save to CSV with year in filename
+    output_file = output_filename(year, args.test)
+    try:
+        if getattr(args, 'revalidate', False) and os.path.exists(output_file):
+            rows, completed = revalidate_year(scraper, year, output_file)
+            output_file = changed_filename(output_file)
+        else:
+            rows, completed = run_year(scraper, year, output_file, incremental=args.incremental)
+    finally:
+        scraper.close()
+
+    total_time = time.time() - start_time
+    logger.info(f"{output_file} holds {rows} advice entries. Total runtime: {total_time:.2f} seconds")
+    return {
+        'year': year,
+        'output_file': output_file,
+        'rows': rows,
+        'completed': completed,
+        'seconds': round(total_time, 2)
+    }
+
+
+def scrape_years(years, args):
+    """Scrape several years in a process pool, one scraper (driver or HTTP client) per process.
+
+    Each process paces itself with its own rate limiter, so --max-rate is
+    split evenly between them to keep the site's total load within it.
+    """
+    start_time = time.time()
+    summary_file = f'scrape_summary_{years[0]}-{years[-1]}.json'
+    processes = min(args.processes, len(years))
+    process_args = argparse.Namespace(**{**vars(args), 'max_rate': args.max_rate / processes})
+    logger.info(f"Scraping {len(years)} years with {processes} processes at up to "
+                f"{process_args.max_rate:.2f} requests/second each, progress in {summary_file}")
+
+    summaries = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {executor.submit(scrape_year, year, process_args): year for year in years}
+        for future in as_completed(futures):
+            year = futures[future]
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                logger.error(f"Scraping year {year} failed: {e}")
+                summaries.append({'year': year, 'rows': 0, 'completed': False, 'error': str(e)})
+
+            summaries.sort(key=lambda summary: summary['year'])
+            done = sum(1 for summary in summaries if summary['completed'])
+            progress = {
+                'years_total': len(years),
+                'years_finished': len(summaries),
+                'years_completed': done,
+                'rows': sum(summary['rows'] for summary in summaries),
+                'elapsed_seconds': round(time.time() - start_time, 2),
+                'years': summaries
+            }
+            with open(summary_file, 'w') as f:
+                json.dump(progress, f, indent=2)
+            logger.info(f"Progress: {len(summaries)}/{len(years)} years finished ({done} complete), "
+                        f"{progress['rows']} advices, {progress['elapsed_seconds']:.0f} seconds")
+
+    for summary in summaries:
+        status = 'complete' if summary['completed'] else 'INCOMPLETE'
+        logger.info(f"  {summary['year']}: {summary['rows']} advices, {status}")
+    return summaries
+
+
+def add_scraper_arguments(parser):
+    """Add the options that configure a RaadVanStateScraper, shared with the scraper daemon"""
+    parser.add_argument('--test', action='store_true', help='Run in test mode (only 10 advices)')
+    parser.add_argument('--backend', choices=['http', 'selenium'], default='selenium',
+                        help='Fetch pages over plain HTTP (Selenium only as fallback) or with headless Chrome')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum parallel requests for the http backend')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of parallel Chrome drivers for detail pages (selenium backend)')
+    parser.add_argument('--extraction', choices=['dom', 'page_source'], default='dom',
+                        help='Extract detail fields with per-element WebDriver calls or by parsing page_source once')
+    parser.add_argument('--prefetch', type=int, default=0,
+                        help='Harvest up to this many overview pages ahead of the detail fetchers (0 = off)')
+    parser.add_argument('--cache-dir', type=str, default='.page_cache',
+                        help='Directory of the on-disk cache of fetched pages (default: .page_cache); detail pages '
+                             'are only cached with --extraction page_source or --backend http')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the page cache')
+    parser.add_argument('--cache-ttl', type=float, default=24,
+                        help='Hours before cached pages are revalidated (detail pages of past years never expire)')
+    parser.add_argument('--cache-max-mb', type=int, default=2048,
+                        help='Size cap of the page cache; least recently used pages are removed beyond it')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch advices missing from the existing year file and append them to it')
+    parser.add_argument('--max-rate', type=float, default=8.0,
+                        help='Upper bound in requests/second for the adaptive rate limiter (it starts at 1)')
+    parser.add_argument('--block-resources', action='store_true',
+                        help='Stop Chrome from loading images, fonts, CSS, media and trackers')
+    parser.add_argument('--no-detail-js', action='store_true',
+                        help='Disable JavaScript in Chrome while loading detail pages')
+    parser.add_argument('--recycle-after', type=int, default=0,
+                        help='Restart each Chrome driver after this many page loads to limit memory growth (0 = never)')
+    parser.add_argument('--ready-strategy', choices=['load', 'dom-ready', 'network-idle'], default='load',
+                        help='When a Chrome page counts as loaded: load event, DOMContentLoaded, or no new requests')
+    parser.add_argument('--overview-wait', type=float, default=2.0,
+                        help='Seconds to wait for the entries of an overview page')
+    parser.add_argument('--detail-wait', type=float, default=2.0,
+                        help='Seconds to wait for the text of a detail page')
+    parser.add_argument('--archive-dir', type=str, default=None,
+                        help='Keep the raw HTML of every fetched page in a compressed per-year archive here')
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help='Export phase timings and counters here (.prom: Prometheus textfile, otherwise JSON)')
+    parser.add_argument('--metrics-interval', type=float, default=60.0,
+                        help='Seconds between metrics exports during a run')
+    parser.add_argument('--page-size', type=int, default=None,
+                        help='Advices per overview page (pager_rows); by default the largest size the site serves is probed')
+    parser.add_argument('--base-url', type=str, default=None,
+                        help='Site to scrape, e.g. a local fixture server (default: https://www.raadvanstate.nl)')
+
+
 def main():
     print("Starting main function")  # Basic print for debugging
     parser = argparse.ArgumentParser(description='Scrape Raad van State advices')
-    parser.add_argument('--test', action='store_true', help='Run in test mode (only 10 advices)')
     parser.add_argument('--year', type=str, help='Year to scrape (e.g., 2024)', default="2025")
+    parser.add_argument('--years', type=str,
+                        help='Scrape several years in parallel, e.g. 1990-2026 or 2019,2021-2023 (overrides --year)')
+    parser.add_argument('--processes', type=int, default=4,
+                        help='Number of years scraped at the same time with --years')
+    parser.add_argument('--revalidate', action='store_true',
+                        help='Re-fetch already scraped years and write only new or changed advices to *_changed.csv')
+    add_scraper_arguments(parser)
     args = parser.parse_args()
 
-    print(f"Arguments received: test={args.test}, year={args.year}")  # Print arguments
+    print(f"Arguments received: test={args.test}, year={args.years or args.year}")  # Print arguments
 
     try:
-        start_time = time.time()
-        logger.info(f"Starting scraper for year: {args.year}")
-
-        scraper = RaadVanStateScraper(batch_size=200, test_mode=args.test, year=args.year)
-        df = scraper.scrape()
-
-        # Save to CSV with year in filename
-        output_file = f'raad_van_state_adviezen_{args.year}_test.csv' if args.test else f'raad_van_state_adviezen_{args.year}.csv'
-        df.to_csv(output_file, index=False)
-
-        total_time = time.time() - start_time
-        logger.info(f"Saved {len(df)} advice entries to {output_file}. Total runtime: {total_time:.2f} seconds")
+        if args.years:
+            scrape_years(parse_years(args.years), args)
+        else:
+            scrape_year(args.year, args)
     except Exception as e:
         print(f"An error occurred: {str(e)}")  # Print any errors
         raise  # Re-raise the exception to see the full traceback
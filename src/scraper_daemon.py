@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+import os
+import json
+import time
+import uuid
+import signal
+import socket
+import logging
+import argparse
+from scraper import RaadVanStateScraper, add_scraper_arguments, build_scraper, output_filename, run_year
+from row_writer import CheckpointedCsvWriter
+
+logger = logging.getLogger(__name__)
+
+
+def process_alive(pid):
+    """Whether a process with this pid runs on this machine"""
+    if os.name == 'nt':
+        # os.kill(pid, 0) would send Ctrl-C on Windows, so ask the process table instead
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, but belongs to another user
+    return True
+
+
+class ScraperDaemon:
+    """Keep one warm scraper (driver, pool or HTTP client) alive and run jobs from a job directory.
+
+    Jobs are JSON files dropped into <job_dir>/incoming:
+        {"year": "2025", "incremental": true}
+        {"urls": ["https://www.raadvanstate.nl/adviezen/..."], "output_file": "extra.csv"}
+        {"command": "stop"}
+    A job is claimed by moving it to running/ under a name recording the
+    claiming daemon's host and pid (<job>@<host>@<pid>.json), and ends up in
+    done/ or failed/ with a "result" added. On start-up, jobs left in
+    running/ by a daemon on this host that is no longer alive are picked up
+    again and resume from their checkpoint; jobs of live daemons, and of
+    other hosts sharing the directory, are left to their owner.
+    """
+
+    def __init__(self, scraper: RaadVanStateScraper, job_dir, poll_interval=5.0, incremental=False):
+        self.scraper = scraper
+        self.job_dir = job_dir
+        self.poll_interval = poll_interval
+        self.incremental = incremental
+        self.stopping = False
+        self.jobs_run = 0
+
+        for state in ('incoming', 'running', 'done', 'failed'):
+            os.makedirs(os.path.join(job_dir, state), exist_ok=True)
+
+        self.owner = f"{socket.gethostname()}@{os.getpid()}"
+        self.requeue_orphaned_jobs()
+
+    def state_dir(self, state):
+        return os.path.join(self.job_dir, state)
+
+    def requeue_orphaned_jobs(self):
+        """Put jobs whose daemon died back in the queue"""
+        host = socket.gethostname()
+        for name in os.listdir(self.state_dir('running')):
+            job_name, _, owner = name[:-len('.json')].partition('@')
+            owner_host, _, pid = owner.rpartition('@')
+            if owner and owner_host != host:
+                logger.info(f"Leaving job {job_name} to its daemon on {owner_host}")
+                continue
+            # A restarted container can give this daemon the pid of the one that died
+            if owner and pid.isdigit() and int(pid) != os.getpid() and process_alive(int(pid)):
+                logger.info(f"Leaving job {job_name} to its running daemon (pid {pid})")
+                continue
+            logger.warning(f"Requeueing interrupted job {job_name}")
+            try:
+                os.replace(os.path.join(self.state_dir('running'), name),
+                           os.path.join(self.state_dir('incoming'), f"{job_name}.json"))
+            except FileNotFoundError:
+                continue  # Requeued by another daemon starting at the same time
+
+    def claim_next_job(self):
+        """Move the oldest incoming job to running/ and return its path, or None if there is none"""
+        names = sorted(name for name in os.listdir(self.state_dir('incoming')) if name.endswith('.json'))
+        for name in names:
+            # The owner in the name keeps other daemons from taking the job over while this one lives
+            running_path = os.path.join(self.state_dir('running'), f"{name[:-len('.json')]}@{self.owner}.json")
+            try:
+                os.replace(os.path.join(self.state_dir('incoming'), name), running_path)
+            except FileNotFoundError:
+                continue  # Claimed by another daemon sharing the directory
+            return running_path
+        return None
+
+    def run_job(self, job):
+        """Run a single job and return its result"""
+        if 'year' in job:
+            year = str(job['year'])
+            output_file = job.get('output_file') or output_filename(year, self.scraper.test_mode)
+            rows, completed = run_year(self.scraper, year, output_file,
+                                       incremental=job.get('incremental', self.incremental))
+            return {'output_file': output_file, 'rows': rows, 'completed': completed}
+
+        if 'urls' in job:
+            return self.run_url_job(job['urls'], job.get('output_file') or 'raad_van_state_adviezen_urls.csv')
+
+        raise ValueError(f"Job needs a 'year', 'urls' or 'command': {job}")
+
+    def run_url_job(self, urls, output_file):
+        """Fetch a list of advice URLs into output_file, resuming from a checkpoint if there is one"""
+        writer = CheckpointedCsvWriter(output_file)
+        start = writer.checkpoint['entry'] if writer.checkpoint else 0
+        completed = False
+        try:
+            writer.open()
+            pending = [{'url': url} for url in urls[start:]]
+            for i, (result, advice) in enumerate(zip(pending, self.scraper.fetch_advices(pending)), start):
+                result.update(advice)
+                writer.write(result, 0, i)
+            completed = True
+        finally:
+            writer.close(complete=completed)
+        return {'output_file': output_file, 'rows': writer.rows_written, 'completed': completed}
+
+    def finish_job(self, running_path, job, result, state):
+        job['result'] = result
+        with open(running_path, 'w') as f:
+            json.dump(job, f, indent=2)
+        job_name = os.path.basename(running_path).partition('@')[0]
+        os.replace(running_path, os.path.join(self.state_dir(state), f"{job_name}.json"))
+
+    def stop(self, *_):
+        logger.info("Stop requested, finishing the current job first")
+        self.stopping = True
+
+    def serve(self):
+        """Run jobs until stopped by a stop job, SIGTERM or Ctrl-C"""
+        signal.signal(signal.SIGTERM, self.stop)
+        logger.info(f"Scraper daemon watching {self.state_dir('incoming')}")
+
+        while not self.stopping:
+            running_path = self.claim_next_job()
+            if running_path is None:
+                time.sleep(self.poll_interval)
+                continue
+
+            with open(running_path) as f:
+                job = json.load(f)
+            if job.get('command') == 'stop':
+                self.finish_job(running_path, job, {'stopped': True}, 'done')
+                break
+
+            start_time = time.time()
+            logger.info(f"Starting job {os.path.basename(running_path)}: {job}")
+            try:
+                result = self.run_job(job)
+                result['seconds'] = round(time.time() - start_time, 2)
+                state = 'done' if result['completed'] else 'failed'
+            except Exception as e:
+                logger.error(f"Job {os.path.basename(running_path)} failed: {e}")
+                result, state = {'error': str(e), 'seconds': round(time.time() - start_time, 2)}, 'failed'
+            self.finish_job(running_path, job, result, state)
+            self.jobs_run += 1
+            logger.info(f"Job {os.path.basename(running_path)} {state} in {result['seconds']:.2f} seconds")
+
+            self.scraper.metrics.export()
+            # Between jobs nothing else uses the main driver, so it can be restarted if it is due
+            self.scraper.maybe_recycle_main_driver()
+
+        logger.info(f"Scraper daemon stopped after {self.jobs_run} jobs")
+
+
+def submit_job(job_dir, job):
+    """Write a job file into the daemon's incoming directory"""
+    incoming = os.path.join(job_dir, 'incoming')
+    os.makedirs(incoming, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}.json"
+    tmp_path = os.path.join(job_dir, f".{name}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(job, f, indent=2)
+    # Rename so the daemon never sees a half-written job
+    os.replace(tmp_path, os.path.join(incoming, name))
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the Raad van State scraper as a long-lived daemon')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+
+    serve = subparsers.add_parser('serve', help='Start the daemon with a warm browser session')
+    serve.add_argument('--job-dir', default='scraper_jobs', help='Directory the daemon takes jobs from')
+    serve.add_argument('--poll-interval', type=float, default=5.0, help='Seconds between checks for new jobs')
+    add_scraper_arguments(serve)
+
+    submit = subparsers.add_parser('submit', help='Queue a job for a running daemon')
+    submit.add_argument('--job-dir', default='scraper_jobs', help='Directory the daemon takes jobs from')
+    submit.add_argument('--year', type=str, help='Year to scrape')
+    submit.add_argument('--incremental', action='store_true', help='Only fetch advices missing from the year file')
+    submit.add_argument('--urls-file', type=str, help='File with one advice URL per line to fetch')
+    submit.add_argument('--output-file', type=str, help='Output CSV (default: the year file)')
+    submit.add_argument('--stop', action='store_true', help='Ask the daemon to stop after the queued jobs')
+    args = parser.parse_args()
+
+    if args.action == 'submit':
+        if args.stop:
+            job = {'command': 'stop'}
+        elif args.year:
+            job = {'year': args.year, 'incremental': args.incremental}
+        elif args.urls_file:
+            with open(args.urls_file) as f:
+                job = {'urls': [line.strip() for line in f if line.strip()]}
+        else:
+            parser.error('submit needs --year, --urls-file or --stop')
+        if args.output_file:
+            job['output_file'] = args.output_file
+        print(f"Queued job {submit_job(args.job_dir, job)}")
+        return
+
+    start_time = time.time()
+    scraper = build_scraper(args, year=None)
+    logger.info(f"Warm scraper ready in {time.time() - start_time:.2f} seconds")
+    daemon = ScraperDaemon(scraper, args.job_dir, poll_interval=args.poll_interval, incremental=args.incremental)
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        logger.info("Interrupted; unfinished jobs will be resumed on the next start")
+    finally:
+        scraper.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the histogram buckets, as in a Prometheus histogram
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PREFIX = 'raadvanstate_scraper'
+
+
+class ScraperMetrics:
+    """Per-phase timing histograms and event counters of a scraper, exportable for monitoring.
+
+    Phases are timed with observe(phase, seconds), e.g. 'detail_load' or
+    'dates_extraction'; events are counted with increment(counter, kind),
+    e.g. ('pages', 'detail') or ('timeouts', 'overview'). With an export
+    file, maybe_export() rewrites it at most every interval seconds and
+    export() at the end of a run. A file ending in .prom is written in the
+    Prometheus textfile collector format, anything else as JSON.
+    """
+
+    def __init__(self, export_file=None, interval=60.0):
+        self.export_file = export_file
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.last_export = self.started
+        # phase -> [bucket counts (last one is +Inf), sum, count, max]
+        self.histograms = {}
+        # (counter, kind) -> count
+        self.counters = {}
+
+    def observe(self, phase, seconds):
+        with self.lock:
+            histogram = self.histograms.get(phase)
+            if histogram is None:
+                histogram = self.histograms[phase] = [[0] * (len(BUCKETS) + 1), 0.0, 0, 0.0]
+            histogram[0][bisect.bisect_left(BUCKETS, seconds)] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            histogram[3] = max(histogram[3], seconds)
+
+    def increment(self, counter, kind='', amount=1):
+        with self.lock:
+            self.counters[(counter, kind)] = self.counters.get((counter, kind), 0) + amount
+
+    def snapshot(self):
+        """All metrics as a JSON-serialisable dict"""
+        with self.lock:
+            phases = {}
+            for phase, (buckets, total, count, maximum) in sorted(self.histograms.items()):
+                cumulative = 0
+                bucket_counts = {}
+                for bound, bucket_count in zip(BUCKETS + ('+Inf',), buckets):
+                    cumulative += bucket_count
+                    bucket_counts[str(bound)] = cumulative
+                phases[phase] = {
+                    'count': count,
+                    'sum': round(total, 6),
+                    'mean': round(total / count, 6),
+                    'max': round(maximum, 6),
+                    'buckets': bucket_counts
+                }
+            counters = {}
+            for (counter, kind), value in sorted(self.counters.items()):
+                counters.setdefault(counter, {})[kind or 'total'] = value
+        now = time.time()
+        return {
+            'updated_at': now,
+            'uptime_seconds': round(now - self.started, 3),
+            'phases': phases,
+            'counters': counters
+        }
+
+    def prometheus_text(self):
+        """All metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = [f'# HELP {PREFIX}_phase_seconds Duration of each scraping phase',
+                 f'# TYPE {PREFIX}_phase_seconds histogram']
+        for phase, histogram in snapshot['phases'].items():
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{PREFIX}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}')
+            lines.append(f'{PREFIX}_phase_seconds_sum{{phase="{phase}"}} {histogram["sum"]}')
+            lines.append(f'{PREFIX}_phase_seconds_count{{phase="{phase}"}} {histogram["count"]}')
+        for counter, kinds in snapshot['counters'].items():
+            lines.append(f'# TYPE {PREFIX}_{counter}_total counter')
+            for kind, value in kinds.items():
+                labels = '' if kind == 'total' else f'{{kind="{kind}"}}'
+                lines.append(f'{PREFIX}_{counter}_total{labels} {value}')
+        lines.append(f'# TYPE {PREFIX}_last_export_timestamp_seconds gauge')
+        lines.append(f'{PREFIX}_last_export_timestamp_seconds {snapshot["updated_at"]:.3f}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self):
+        """Write the metrics to the export file, if there is one"""
+        if not self.export_file:
+            return
+        if self.export_file.endswith('.prom'):
+            text = self.prometheus_text()
+        else:
+            text = json.dumps(self.snapshot(), indent=2)
+        # Write and rename, so collectors never read a half-written file
+        tmp_file = f"{self.export_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write(text)
+            os.replace(tmp_file, self.export_file)
+        except OSError as e:
+            logger.warning(f"Could not export metrics to {self.export_file}: {e}")
+        self.last_export = time.time()
+
+    def maybe_export(self):
+        """Export if the last export is more than interval seconds ago"""
+        if self.export_file and time.time() - self.last_export >= self.interval:
+            self.export()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+import os
+import json
+import time
+import socket
+import logging
+import sqlite3
+import argparse
+import pandas as pd
+from scraper import add_scraper_arguments, build_scraper, output_filename, parse_years
+from row_writer import COLUMNS
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    year TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    entry INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_at REAL,
+    added_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT,
+    advice TEXT
+);
+CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status, year, page, entry);
+CREATE TABLE IF NOT EXISTS harvests (
+    year TEXT PRIMARY KEY,
+    pages INTEGER NOT NULL DEFAULT 0,
+    page_size INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class UrlFrontier:
+    """Durable list of advice URLs to fetch, kept in a SQLite database.
+
+    Phase one (harvest) walks the overview pages of a year and adds every
+    advice URL as 'pending'. Phase two (consume) claims batches of URLs,
+    fetches them and marks each one 'fetched' (with the extracted advice
+    stored alongside) or 'failed'. Claims are leases: a URL claimed by a
+    worker that died is handed out again once the lease has expired, so any
+    number of workers, also on other machines sharing the database file,
+    can consume the same frontier.
+
+    The database uses SQLite's rollback journal, whose file locks also work
+    on network filesystems. wal=True switches to write-ahead logging, which
+    lets readers and a writer proceed at once but needs shared memory, so
+    only works when every worker runs on the machine holding the file.
+    """
+
+    def __init__(self, db_path, lease=600.0, wal=False):
+        self.db_path = db_path
+        self.lease = lease
+        # Autocommit mode; claims use explicit BEGIN IMMEDIATE transactions
+        self.db = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(f"PRAGMA journal_mode={'WAL' if wal else 'DELETE'}")
+        self.db.executescript(SCHEMA)
+        # Frontiers created before page sizes were probed
+        columns = [row['name'] for row in self.db.execute('PRAGMA table_info(harvests)')]
+        if 'page_size' not in columns:
+            self.db.execute('ALTER TABLE harvests ADD COLUMN page_size INTEGER')
+
+    def close(self):
+        self.db.close()
+
+    def harvest_state(self, year):
+        """Return (next page, completed, page size) of the harvest of a year"""
+        row = self.db.execute('SELECT pages, completed, page_size FROM harvests WHERE year = ?', (year,)).fetchone()
+        return (row['pages'], bool(row['completed']), row['page_size']) if row else (0, False, None)
+
+    def add_page(self, year, page, page_results, page_size, last=False):
+        """Add the advices of one overview page and record the harvest's progress"""
+        now = time.time()
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            cursor = self.db.executemany(
+                'INSERT OR IGNORE INTO frontier (url, year, page, entry, added_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                [(result['url'], year, page, entry, now, now) for entry, result in enumerate(page_results)])
+            self.db.execute(
+                'INSERT OR REPLACE INTO harvests (year, pages, page_size, completed, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (year, page + 1, page_size, int(last), now))
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+        return max(cursor.rowcount, 0)
+
+    def claim(self, worker, limit, years=None, max_attempts=3):
+        """Lease up to limit pending (or retryable failed) URLs to a worker, in overview order"""
+        now = time.time()
+        year_filter = f"AND year IN ({','.join('?' * len(years))})" if years else ''
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            rows = self.db.execute(
+                f"""SELECT url, year, page, entry FROM frontier
+                    WHERE (status = 'pending' OR (status = 'failed' AND attempts < ?))
+                      AND (claimed_at IS NULL OR claimed_at < ?) {year_filter}
+                    ORDER BY year, page, entry LIMIT ?""",
+                (max_attempts, now - self.lease, *(years or []), limit)).fetchall()
+            self.db.executemany(
+                'UPDATE frontier SET claimed_by = ?, claimed_at = ?, attempts = attempts + 1, updated_at = ? '
+                'WHERE url = ?',
+                [(worker, now, now, row['url']) for row in rows])
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+        return [dict(row) for row in rows]
+
+    def mark_fetched(self, url, advice):
+        self.db.execute(
+            "UPDATE frontier SET status = 'fetched', advice = ?, last_error = NULL, claimed_by = NULL, "
+            "claimed_at = NULL, updated_at = ? WHERE url = ?",
+            (json.dumps(advice, ensure_ascii=False), time.time(), url))
+
+    def mark_failed(self, url, error):
+        self.db.execute(
+            "UPDATE frontier SET status = 'failed', last_error = ?, claimed_by = NULL, claimed_at = NULL, "
+            "updated_at = ? WHERE url = ?",
+            (error, time.time(), url))
+
+    def retry_failed(self, years=None):
+        """Give failed URLs a fresh set of attempts; returns how many were reset"""
+        year_filter = f"AND year IN ({','.join('?' * len(years))})" if years else ''
+        cursor = self.db.execute(
+            f"UPDATE frontier SET status = 'pending', attempts = 0, updated_at = ? WHERE status = 'failed' {year_filter}",
+            (time.time(), *(years or [])))
+        return cursor.rowcount
+
+    def counts(self):
+        """Number of URLs per year and status"""
+        counts = {}
+        for row in self.db.execute('SELECT year, status, COUNT(*) AS n FROM frontier GROUP BY year, status'):
+            counts.setdefault(row['year'], {})[row['status']] = row['n']
+        return counts
+
+    def fetched_rows(self, year):
+        """Scraped rows of a year in overview order"""
+        rows = []
+        for row in self.db.execute(
+                "SELECT url, advice FROM frontier WHERE year = ? AND status = 'fetched' ORDER BY page, entry", (year,)):
+            rows.append({'url': row['url'], **json.loads(row['advice'])})
+        return rows
+
+
+def harvest(frontier, scraper, years):
+    """Phase one: add the advice URLs on every overview page of each year to the frontier"""
+    for year in years:
+        start_time = time.time()
+        next_page, completed, page_size = frontier.harvest_state(year)
+        if completed:
+            logger.info(f"Year {year} was already harvested, skipping")
+            continue
+
+        scraper.set_year(year)
+        scraper.start_page = next_page
+        if next_page:
+            logger.info(f"Resuming harvest of {year} at overview page {next_page + 1}")
+            # Page numbers only line up with the page size the harvest started with
+            scraper.batch_size = page_size or scraper.batch_size
+        elif scraper.auto_page_size:
+            scraper.tune_page_size()
+        added = 0
+        for page, page_results in scraper.iter_overview_pages():
+            last = len(page_results) < scraper.batch_size
+            added += frontier.add_page(year, page, page_results, scraper.batch_size, last=last)
+            if last:
+                break
+        logger.info(f"Harvested {added} new advice URLs for {year} in {time.time() - start_time:.2f} seconds")
+
+
+def consume(frontier, scraper, worker, years=None, batch=50, max_attempts=3):
+    """Phase two: fetch claimed URLs until the frontier has nothing left for this worker"""
+    start_time = time.time()
+    fetched = failed = 0
+    while True:
+        claimed = frontier.claim(worker, batch, years=years, max_attempts=max_attempts)
+        if not claimed:
+            break
+        for year in sorted({row['year'] for row in claimed}):
+            # The year decides how long cached pages stay fresh
+            scraper.set_year(year)
+            rows = [row for row in claimed if row['year'] == year]
+            for row, advice in zip(rows, scraper.fetch_advices(rows)):
+                if advice.get('content'):
+                    frontier.mark_fetched(row['url'], advice)
+                    fetched += 1
+                else:
+                    frontier.mark_failed(row['url'], 'no advice text')
+                    failed += 1
+        logger.info(f"Worker {worker}: {fetched} fetched, {failed} failed, "
+                    f"{(fetched + failed) / (time.time() - start_time):.2f} advices/second")
+        scraper.maybe_recycle_main_driver()
+    logger.info(f"Worker {worker} found no more work after {time.time() - start_time:.2f} seconds")
+    return fetched, failed
+
+
+def export(frontier, years, test_mode=False):
+    """Write the fetched advices of each year to its raad_van_state_adviezen_<year>.csv"""
+    for year in years:
+        rows = frontier.fetched_rows(year)
+        output_file = output_filename(year, test_mode)
+        pd.DataFrame(rows, columns=COLUMNS).to_csv(output_file, index=False, encoding='utf-8')
+        logger.info(f"Wrote {len(rows)} advices to {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Two-phase Raad van State scrape through a SQLite URL frontier')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+
+    for action, help_text in [('harvest', 'Add the advice URLs of the given years to the frontier'),
+                              ('consume', 'Fetch pending advices from the frontier'),
+                              ('export', 'Write the fetched advices to one CSV file per year'),
+                              ('status', 'Show the number of advices per year and status'),
+                              ('retry-failed', 'Queue failed advices again with a fresh set of attempts')]:
+        subparser = subparsers.add_parser(action, help=help_text)
+        subparser.add_argument('--db', default='frontier.sqlite', help='SQLite frontier database')
+        subparser.add_argument('--years', type=str, help='Years to work on, e.g. 1990-2026 (default: all)')
+        subparser.add_argument('--wal', action='store_true',
+                               help='Use write-ahead logging (only when all workers share a local disk)')
+        if action == 'consume':
+            subparser.add_argument('--worker-id', type=str, default=f"{socket.gethostname()}-{os.getpid()}",
+                                   help='Name recorded on claimed advices (default: host and pid)')
+            subparser.add_argument('--batch', type=int, default=50, help='Advices claimed at a time')
+            subparser.add_argument('--max-attempts', type=int, default=3,
+                                   help='Attempts per advice before it stays failed')
+            subparser.add_argument('--lease', type=float, default=600.0,
+                                   help='Seconds after which advices claimed by a dead worker are handed out again')
+        if action in ('harvest', 'consume'):
+            add_scraper_arguments(subparser)
+        if action == 'export':
+            subparser.add_argument('--test', action='store_true', help='Write the _test.csv file names')
+    args = parser.parse_args()
+
+    frontier = UrlFrontier(args.db, lease=getattr(args, 'lease', 600.0), wal=args.wal)
+    years = parse_years(args.years) if args.years else None
+    try:
+        if args.action in ('harvest', 'consume'):
+            if args.action == 'harvest' and not years:
+                parser.error('harvest needs --years')
+            scraper = build_scraper(args, year=years[0] if years else None)
+            try:
+                if args.action == 'harvest':
+                    harvest(frontier, scraper, years)
+                else:
+                    consume(frontier, scraper, args.worker_id, years=years,
+                            batch=args.batch, max_attempts=args.max_attempts)
+            finally:
+                scraper.close()
+        elif args.action == 'export':
+            export(frontier, years or sorted(frontier.counts()), test_mode=args.test)
+        elif args.action == 'retry-failed':
+            print(f"Requeued {frontier.retry_failed(years)} failed advices")
+
+        if args.action != 'export':
+            for year, statuses in sorted(frontier.counts().items()):
+                print(f"{year}: " + ', '.join(f"{n} {status}" for status, n in sorted(statuses.items())))
+    finally:
+        frontier.close()
+
+if __name__ == "__main__":
+    main()